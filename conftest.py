@@ -0,0 +1,12 @@
+import pytest
+
+from hjortmath import native_available
+
+
+needs_native = pytest.mark.skipif(not native_available(), reason="libcmat.so is not built")
+
+
+@pytest.fixture(params=[pytest.param(True, marks=needs_native, id="C"), pytest.param(False, id="python")])
+def use_C(request):
+    """Run the test once against the native kernels and once against pykernels"""
+    return request.param
@@ -1,9 +1,7 @@
 """MATMATH - A matrix library with C backend for performance"""
 
 from .imports import (
-    random, time, 
     Self, Any, Union, List, Tuple, Optional,
-    ctypes, os
 )
 
 from .customdecorators import (
@@ -12,30 +10,68 @@ from .customdecorators import (
     performance_warning,
 )
 
+from .dtypes import (
+    DType,
+    float32, float64, int32, int64,
+    promote_types,
+)
+
+from .config import (
+    MatrixConfig,
+    config_context,
+    get_default_config,
+)
+
 from .pymat import Matrix
 
+from .ufuncs import (
+    exp, log, sqrt, tanh, sigmoid,
+    absolute, power, clip,
+    gt, ge, lt, le, eq, ne,
+)
+
 from .cmat import (
+    backend_info,
+    native_available,
     mat_det,
     mat_inv,
     mat_add,
     mat_sub,
     mat_mul,
     hadamard,
+    mat_pow,
+    mat_expm,
+    random_uniform,
+    random_normal,
+    random_integers,
 )
 
 __all__ = [
     # Main class
     'Matrix',
     
+    # Configuration
+    'MatrixConfig', 'config_context', 'get_default_config',
+    
+    # Dtypes
+    'DType', 'float32', 'float64', 'int32', 'int64', 'promote_types',
+    
+    # Elementwise functions
+    'exp', 'log', 'sqrt', 'tanh', 'sigmoid', 'absolute', 'power', 'clip',
+    'gt', 'ge', 'lt', 'le', 'eq', 'ne',
+    
+    # Backend
+    'backend_info', 'native_available',
+    
     # C functions
-    'mat_det', 'mat_inv', 'mat_add', 'mat_sub', 'mat_mul', 'hadamard',
+    'mat_det', 'mat_inv', 'mat_add', 'mat_sub', 'mat_mul', 'hadamard', 'mat_pow', 'mat_expm',
+    'random_uniform', 'random_normal', 'random_integers',
     
     # Decorators
     'alias', 'validate_dimensions', 'performance_warning',
     
-    # Types and modules
+    # Types
     'Self', 'Any', 'Union', 'List', 'Tuple', 'Optional',
-    'random', 'time', 'ctypes', 'os',
 ]
 
 __version__ = '0.1.0'
\ No newline at end of file
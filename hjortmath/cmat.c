@@ -1,204 +1,739 @@
 #include <stdio.h>
 #include <stdlib.h>
-#include <string.h> 
+#include <stdint.h>
+#include <string.h>
 #include <math.h>
+#include <tgmath.h>
+#ifdef _OPENMP
 #include <omp.h>
+#endif
 
 __attribute__((constructor))
 void init_omp() {
+#ifdef _OPENMP
     omp_set_num_threads(4);
+#endif
 }
 
-void mat_add(const double* A,
-             const double* B,
-             double* C,
-             size_t size,
-             int use_OMP)
-{
-    #pragma omp parallel for if(use_OMP)
-    for (size_t i = 0; i < size; i++)
-        C[i] = A[i] + B[i];
+/* Capability probe, reported by cmat.backend_info(). */
+int cmat_openmp_version(void) {
+#ifdef _OPENMP
+    return _OPENMP;
+#else
+    return 0;
+#endif
 }
 
-void mat_sub(const double* A,
-             const double* B,
-             double* C,
-             size_t size,
-             int use_OMP)
-{
-    #pragma omp parallel for if(use_OMP)
-    for (size_t i = 0; i < size; i++)
-        C[i] = A[i] - B[i];
+int cmat_max_threads(void) {
+#ifdef _OPENMP
+    return omp_get_max_threads();
+#else
+    return 1;
+#endif
 }
 
-void hadamard(const double* A,
-              const double* B,
-              double* C,
-              size_t size,
-              int use_OMP)
-{
-    #pragma omp parallel for if(use_OMP)
-    for (size_t i = 0; i < size; i++)
-        C[i] = A[i] * B[i];
+/* Widest vector instruction set the kernels were compiled for. */
+const char* cmat_simd_level(void) {
+#if defined(__AVX512F__)
+    return "avx512";
+#elif defined(__AVX2__)
+    return "avx2";
+#elif defined(__AVX__)
+    return "avx";
+#elif defined(__SSE4_2__)
+    return "sse4.2";
+#elif defined(__SSE2__)
+    return "sse2";
+#elif defined(__ARM_NEON)
+    return "neon";
+#else
+    return "none";
+#endif
 }
 
-void mat_mul(const double* A, const double* B, double* C,
-             size_t m, size_t n, size_t p,
-             int use_OMP)
-{
-    printf("DEBUG: mat_mul %zux%zu, use_OMP=%d, threads=%d\n", 
-           m, p, use_OMP, omp_get_max_threads());
-    
-    #pragma omp parallel for if(use_OMP)
-    for (size_t i = 0; i < m; i++)
-        for (size_t j = 0; j < p; j++)
-            C[i*p + j] = 0.0;
-
-    #pragma omp parallel for if(use_OMP) collapse(2)
-    for (size_t i = 0; i < m; i++)
-    {
-        if (i == 0 && omp_in_parallel()) {
-            printf("DEBUG: Actually running in parallel with %d threads\n", 
-                   omp_get_num_threads());
-        }
-        for (size_t k = 0; k < n; k++)
-        {
-            double a = A[i*n + k];
-            for (size_t j = 0; j < p; j++)
-                C[i*p + j] += a * B[k*p + j];
-        }
-    }
+/*
+ * Every kernel is generated once per supported element type and exported
+ * with a dtype suffix: mat_add_f32, mat_add_f64, mat_add_i32, mat_add_i64.
+ * The Python side (cmat.py) picks the variant from the Matrix dtype.
+ *
+ * Integer overflow wraps (two's complement); the Makefile builds with
+ * -fwrapv so this is defined behaviour, and pykernels wraps the same way.
+ */
+#define FOR_EACH_DTYPE(X) \
+    X(f32, float)         \
+    X(f64, double)        \
+    X(i32, int32_t)       \
+    X(i64, int64_t)
+
+#define FOR_EACH_FLOAT_DTYPE(X) \
+    X(f32, float)               \
+    X(f64, double)
+
+#define DEFINE_ELEMENTWISE(NAME, OP, SFX, T)                 \
+void NAME##_##SFX(const T* A,                                \
+                  const T* B,                                \
+                  T* C,                                      \
+                  size_t size,                               \
+                  int use_OMP)                               \
+{                                                            \
+    _Pragma("omp parallel for simd if(parallel: use_OMP)")             \
+    for (size_t i = 0; i < size; i++)                        \
+        C[i] = A[i] OP B[i];                                 \
 }
 
-void scalar_mul(const double* A,
-                double scalar,
-                double* C,
-                size_t size,
-                int use_OMP)
-{
-    #pragma omp parallel for if(use_OMP)
-    for (size_t i = 0; i < size; i++)
-        C[i] = A[i] * scalar;
+#define DEFINE_ARITHMETIC(SFX, T)              \
+    DEFINE_ELEMENTWISE(mat_add, +, SFX, T)     \
+    DEFINE_ELEMENTWISE(mat_sub, -, SFX, T)     \
+    DEFINE_ELEMENTWISE(hadamard, *, SFX, T)
+
+FOR_EACH_DTYPE(DEFINE_ARITHMETIC)
+
+/*
+ * Broadcasting elementwise kernels. Each operand is described by a row and a
+ * column stride into its own buffer; a stride of 0 repeats the operand along
+ * that axis, so scalars (0,0), row vectors (0,1) and column vectors (1,0) are
+ * read in place and never expanded to the m x n result.
+ */
+#define BCAST_FLAT_LOOP(EXPR)                                \
+    _Pragma("omp parallel for simd if(parallel: use_OMP)")             \
+    for (size_t i = 0; i < size; i++)                        \
+        C[i] = EXPR;
+
+#define BCAST_ROW_LOOP(EXPR)                                 \
+    _Pragma("omp simd")                                      \
+    for (size_t j = 0; j < n; j++)                           \
+        c[j] = EXPR;
+
+#define DEFINE_BROADCAST(NAME, OP, SFX, T)                                   \
+void NAME##_bcast_##SFX(const T* A, size_t a_rs, size_t a_cs,                \
+                        const T* B, size_t b_rs, size_t b_cs,                \
+                        T* C, size_t m, size_t n, int use_OMP)               \
+{                                                                            \
+    if (a_rs == n * a_cs && b_rs == n * b_cs) {                              \
+        /* full or scalar operands only: one flat pass over m*n */           \
+        const size_t size = m * n;                                           \
+        const T av = A[0];                                                   \
+        const T bv = B[0];                                                   \
+        if (a_cs && b_cs)  { BCAST_FLAT_LOOP(A[i] OP B[i]) }                 \
+        else if (a_cs)     { BCAST_FLAT_LOOP(A[i] OP bv) }                   \
+        else if (b_cs)     { BCAST_FLAT_LOOP(av OP B[i]) }                   \
+        else               { BCAST_FLAT_LOOP(av OP bv) }                     \
+        return;                                                              \
+    }                                                                        \
+                                                                             \
+    _Pragma("omp parallel for if(use_OMP)")                                  \
+    for (size_t i = 0; i < m; i++) {                                         \
+        const T* a = A + i * a_rs;                                           \
+        const T* b = B + i * b_rs;                                           \
+        T* c = C + i * n;                                                    \
+        const T av = a[0];                                                   \
+        const T bv = b[0];                                                   \
+        if (a_cs && b_cs)  { BCAST_ROW_LOOP(a[j] OP b[j]) }                  \
+        else if (a_cs)     { BCAST_ROW_LOOP(a[j] OP bv) }                    \
+        else if (b_cs)     { BCAST_ROW_LOOP(av OP b[j]) }                    \
+        else               { BCAST_ROW_LOOP(av OP bv) }                      \
+    }                                                                        \
 }
 
-double mat_det(const double* A, size_t n, int use_OMP) {
-    if (n == 0) return 0;
-    if (n == 1) return A[0];
+#define DEFINE_BROADCAST_ARITHMETIC(SFX, T)           \
+    DEFINE_BROADCAST(mat_add, +, SFX, T)              \
+    DEFINE_BROADCAST(mat_sub, -, SFX, T)              \
+    DEFINE_BROADCAST(hadamard, *, SFX, T)
 
-    double* temp = malloc(n * n * sizeof(double));
-    memcpy(temp, A, n * n * sizeof(double));
+FOR_EACH_DTYPE(DEFINE_BROADCAST_ARITHMETIC)
 
-    double det = 1.0;
+/* Division is floating point only; integer operands are promoted to f64 in Python. */
+#define DEFINE_BROADCAST_DIVISION(SFX, T)             \
+    DEFINE_BROADCAST(mat_div, /, SFX, T)
 
-    for (size_t i = 0; i < n; i++) {
-        size_t pivot = i;
-        for (size_t j = i + 1; j < n; j++) {
-            if (fabs(temp[j * n + i]) > fabs(temp[pivot * n + i])) {
-                pivot = j;
-            }
-        }
+FOR_EACH_FLOAT_DTYPE(DEFINE_BROADCAST_DIVISION)
 
-        if (pivot != i) {
-            for (size_t k = 0; k < n; k++) {
-                double swap = temp[i * n + k];
-                temp[i * n + k] = temp[pivot * n + k];
-                temp[pivot * n + k] = swap;
-            }
-            det *= -1.0;
-        }
+#define DEFINE_MAT_MUL(SFX, T)                               \
+void mat_mul_##SFX(const T* A, const T* B, T* C,             \
+                   size_t m, size_t n, size_t p,             \
+                   int use_OMP)                              \
+{                                                            \
+    _Pragma("omp parallel for if(use_OMP)")                  \
+    for (size_t i = 0; i < m; i++)                           \
+    {                                                        \
+        T* row = C + i*p;                                    \
+        for (size_t j = 0; j < p; j++)                       \
+            row[j] = 0;                                      \
+        for (size_t k = 0; k < n; k++)                       \
+        {                                                    \
+            T a = A[i*n + k];                                \
+            const T* b = B + k*p;                            \
+            _Pragma("omp simd")                              \
+            for (size_t j = 0; j < p; j++)                   \
+                row[j] += a * b[j];                          \
+        }                                                    \
+    }                                                        \
+}
 
-        if (fabs(temp[i * n + i]) < 1e-12) {
-            free(temp);
-            return 0.0;
-        }
+FOR_EACH_DTYPE(DEFINE_MAT_MUL)
 
-        det *= temp[i * n + i];
+#define DEFINE_SCALAR_MUL(SFX, T)                            \
+void scalar_mul_##SFX(const T* A,                            \
+                      T scalar,                              \
+                      T* C,                                  \
+                      size_t size,                           \
+                      int use_OMP)                           \
+{                                                            \
+    _Pragma("omp parallel for simd if(parallel: use_OMP)")             \
+    for (size_t i = 0; i < size; i++)                        \
+        C[i] = A[i] * scalar;                                \
+}
 
-        #pragma omp parallel for if(use_OMP)
-        for (size_t j = i + 1; j < n; j++) {
-            double factor = temp[j * n + i] / temp[i * n + i];
-            for (size_t k = i + 1; k < n; k++)
-                temp[j * n + k] -= factor * temp[i * n + k];
+FOR_EACH_DTYPE(DEFINE_SCALAR_MUL)
+
+/*
+ * Unary elementwise functions. C may alias A, which is how the in-place
+ * variants are implemented. Transcendental functions only exist for floating
+ * types (tgmath picks expf/exp etc. from T); integer matrices are promoted to
+ * f64 in Python. Parameterised functions take two scalars (a, b):
+ * clip uses both, power and the comparison masks use only a.
+ */
+#define DEFINE_UNARY(NAME, EXPR, SFX, T)                             \
+void NAME##_##SFX(const T* A, T* C, size_t size, int use_OMP)        \
+{                                                                    \
+    _Pragma("omp parallel for simd if(parallel: use_OMP)")                     \
+    for (size_t i = 0; i < size; i++) {                              \
+        const T x = A[i];                                            \
+        C[i] = EXPR;                                                 \
+    }                                                                \
+}
+
+#define DEFINE_UNARY_PARAM(NAME, EXPR, SFX, T)                       \
+void NAME##_##SFX(const T* A, T a, T b, T* C,                        \
+                  size_t size, int use_OMP)                          \
+{                                                                    \
+    (void)a; (void)b;                                                \
+    _Pragma("omp parallel for simd if(parallel: use_OMP)")                     \
+    for (size_t i = 0; i < size; i++) {                              \
+        const T x = A[i];                                            \
+        C[i] = EXPR;                                                 \
+    }                                                                \
+}
+
+#define DEFINE_FLOAT_UFUNCS(SFX, T)                                  \
+    DEFINE_UNARY(mat_exp, exp(x), SFX, T)                            \
+    DEFINE_UNARY(mat_log, log(x), SFX, T)                            \
+    DEFINE_UNARY(mat_sqrt, sqrt(x), SFX, T)                          \
+    DEFINE_UNARY(mat_tanh, tanh(x), SFX, T)                          \
+    DEFINE_UNARY(mat_sigmoid, 1 / (1 + exp(-x)), SFX, T)             \
+    DEFINE_UNARY(mat_abs, fabs(x), SFX, T)                           \
+    DEFINE_UNARY_PARAM(mat_power,                                    \
+        a == 2 ? x * x : pow(x, a), SFX, T)
+
+FOR_EACH_FLOAT_DTYPE(DEFINE_FLOAT_UFUNCS)
+
+#define DEFINE_INT_UFUNCS(SFX, T)                                    \
+    DEFINE_UNARY(mat_abs, x < 0 ? -x : x, SFX, T)
+
+DEFINE_INT_UFUNCS(i32, int32_t)
+DEFINE_INT_UFUNCS(i64, int64_t)
+
+#define DEFINE_UFUNCS(SFX, T)                                        \
+    DEFINE_UNARY_PARAM(mat_clip, x < a ? a : (x > b ? b : x), SFX, T)\
+    DEFINE_UNARY_PARAM(mat_gt, x > a, SFX, T)                        \
+    DEFINE_UNARY_PARAM(mat_ge, x >= a, SFX, T)                       \
+    DEFINE_UNARY_PARAM(mat_lt, x < a, SFX, T)                        \
+    DEFINE_UNARY_PARAM(mat_le, x <= a, SFX, T)                       \
+    DEFINE_UNARY_PARAM(mat_eq, x == a, SFX, T)                       \
+    DEFINE_UNARY_PARAM(mat_ne, x != a, SFX, T)
+
+FOR_EACH_DTYPE(DEFINE_UFUNCS)
+
+/* Min and max in one pass, written to out[0] and out[1]. Used by repr for color scaling. */
+#define DEFINE_MINMAX(SFX, T)                                        \
+void mat_minmax_##SFX(const T* A, size_t size, T* out, int use_OMP)  \
+{                                                                    \
+    T lo = A[0];                                                     \
+    T hi = A[0];                                                     \
+    _Pragma("omp parallel for simd if(parallel: use_OMP) reduction(min:lo) reduction(max:hi)") \
+    for (size_t i = 1; i < size; i++) {                              \
+        lo = A[i] < lo ? A[i] : lo;                                  \
+        hi = A[i] > hi ? A[i] : hi;                                  \
+    }                                                                \
+    out[0] = lo;                                                     \
+    out[1] = hi;                                                     \
+}
+
+FOR_EACH_DTYPE(DEFINE_MINMAX)
+
+/*
+ * Counter-based random numbers (Philox4x32-10, Salmon et al. 2011).
+ * Entry i is generated from counter (i, 0) under the 64-bit seed as key,
+ * so every entry depends only on (seed, i): results are identical for any
+ * thread count and any schedule. pykernels.py implements the same streams.
+ */
+static inline void philox4x32_10(uint32_t c[4], uint64_t seed) {
+    uint32_t k0 = (uint32_t)seed;
+    uint32_t k1 = (uint32_t)(seed >> 32);
+    for (int r = 0; r < 10; r++) {
+        if (r) {
+            k0 += 0x9E3779B9u;
+            k1 += 0xBB67AE85u;
         }
+        uint64_t p0 = (uint64_t)0xD2511F53u * c[0];
+        uint64_t p1 = (uint64_t)0xCD9E8D57u * c[2];
+        uint32_t n0 = (uint32_t)(p1 >> 32) ^ c[1] ^ k0;
+        uint32_t n2 = (uint32_t)(p0 >> 32) ^ c[3] ^ k1;
+        c[0] = n0;
+        c[1] = (uint32_t)p1;
+        c[2] = n2;
+        c[3] = (uint32_t)p0;
     }
+}
+
+static inline void philox_block(size_t i, uint64_t seed, uint32_t c[4]) {
+    c[0] = (uint32_t)i;
+    c[1] = (uint32_t)((uint64_t)i >> 32);
+    c[2] = 0;
+    c[3] = 0;
+    philox4x32_10(c, seed);
+}
+
+/* 53-bit uniform double in [0, 1) from two 32-bit words. */
+static inline double philox_unit(uint32_t hi, uint32_t lo) {
+    return ((hi >> 5) * 67108864.0 + (lo >> 6)) * (1.0 / 9007199254740992.0);
+}
 
-    free(temp);
-    return det;
+#define DEFINE_RANDOM_FLOAT(SFX, T)                                          \
+void mat_random_uniform_##SFX(T* C, size_t size, uint64_t seed,              \
+                              double low, double high, int use_OMP)          \
+{                                                                            \
+    /* Rounding to T can land on high; clamp to the largest T below it */   \
+    T top = (T)high;                                                         \
+    if ((double)top >= high)                                                 \
+        top = nextafter(top, (T)-INFINITY);                                  \
+    if (top < (T)low)                                                        \
+        top = (T)low;                                                        \
+    _Pragma("omp parallel for if(use_OMP)")                                  \
+    for (size_t i = 0; i < size; i++) {                                      \
+        uint32_t c[4];                                                       \
+        philox_block(i, seed, c);                                            \
+        T v = (T)(low + (high - low) * philox_unit(c[0], c[1]));             \
+        C[i] = v > top ? top : v;                                            \
+    }                                                                        \
+}                                                                            \
+                                                                             \
+void mat_random_normal_##SFX(T* C, size_t size, uint64_t seed,               \
+                             double mean, double std, int use_OMP)           \
+{                                                                            \
+    _Pragma("omp parallel for if(use_OMP)")                                  \
+    for (size_t i = 0; i < size; i++) {                                      \
+        uint32_t c[4];                                                       \
+        philox_block(i, seed, c);                                            \
+        double r = sqrt(-2.0 * log(1.0 - philox_unit(c[0], c[1])));          \
+        double z = r * cos(6.283185307179586 * philox_unit(c[2], c[3]));     \
+        C[i] = (T)(mean + std * z);                                          \
+    }                                                                        \
 }
 
+FOR_EACH_FLOAT_DTYPE(DEFINE_RANDOM_FLOAT)
+
+/*
+ * Integers in the closed range [low, high]; the Python wrappers pass high - 1,
+ * so the span of any int64 range fits in uint64. The offset is the high word
+ * of a 64x64-bit product (multiply-shift), computed entirely in unsigned
+ * arithmetic.
+ */
+#define DEFINE_RANDOM_INT(SFX, T)                                            \
+void mat_random_integers_##SFX(T* C, size_t size, uint64_t seed,             \
+                               int64_t low, int64_t high, int use_OMP)       \
+{                                                                            \
+    const uint64_t span = (uint64_t)high - (uint64_t)low;                    \
+    _Pragma("omp parallel for if(use_OMP)")                                  \
+    for (size_t i = 0; i < size; i++) {                                      \
+        uint32_t c[4];                                                       \
+        philox_block(i, seed, c);                                            \
+        const uint64_t x = ((uint64_t)c[0] << 32) | c[1];                    \
+        const uint64_t offset = span == UINT64_MAX ? x                       \
+            : (uint64_t)(((unsigned __int128)x * (span + 1)) >> 64);         \
+        C[i] = (T)(int64_t)((uint64_t)low + offset);                         \
+    }                                                                        \
+}
+
+DEFINE_RANDOM_INT(i32, int32_t)
+DEFINE_RANDOM_INT(i64, int64_t)
+
+/* Determinant and inverse only exist for floating types; integer matrices are promoted to f64 in Python. */
+#define DEFINE_MAT_DET(SFX, T)                                           \
+double mat_det_##SFX(const T* A, size_t n, int use_OMP) {                \
+    if (n == 0) return 0;                                                \
+    if (n == 1) return A[0];                                             \
+                                                                         \
+    T* temp = malloc(n * n * sizeof(T));                                 \
+    memcpy(temp, A, n * n * sizeof(T));                                  \
+                                                                         \
+    double det = 1.0;                                                    \
+                                                                         \
+    for (size_t i = 0; i < n; i++) {                                     \
+        size_t pivot = i;                                                \
+        for (size_t j = i + 1; j < n; j++) {                             \
+            if (fabs(temp[j * n + i]) > fabs(temp[pivot * n + i])) {     \
+                pivot = j;                                               \
+            }                                                            \
+        }                                                                \
+                                                                         \
+        if (pivot != i) {                                                \
+            for (size_t k = 0; k < n; k++) {                             \
+                T swap = temp[i * n + k];                                \
+                temp[i * n + k] = temp[pivot * n + k];                   \
+                temp[pivot * n + k] = swap;                              \
+            }                                                            \
+            det *= -1.0;                                                 \
+        }                                                                \
+                                                                         \
+        if (fabs(temp[i * n + i]) < 1e-12) {                             \
+            free(temp);                                                  \
+            return 0.0;                                                  \
+        }                                                                \
+                                                                         \
+        det *= temp[i * n + i];                                          \
+                                                                         \
+        _Pragma("omp parallel for if(use_OMP)")                          \
+        for (size_t j = i + 1; j < n; j++) {                             \
+            T factor = temp[j * n + i] / temp[i * n + i];                \
+            for (size_t k = i + 1; k < n; k++)                           \
+                temp[j * n + k] -= factor * temp[i * n + k];             \
+        }                                                                \
+    }                                                                    \
+                                                                         \
+    free(temp);                                                          \
+    return det;                                                          \
+}
+
+FOR_EACH_FLOAT_DTYPE(DEFINE_MAT_DET)
+
 #define IDX(i,j,n) ((i)*(n) + (j))
 
-void mat_inv(const double* A, double* invA, int n, int use_OMP)
+#define DEFINE_MAT_INV(SFX, T)                                           \
+void mat_inv_##SFX(const T* A, T* invA, int n, int use_OMP)              \
+{                                                                        \
+    T* LU = (T*)malloc(n * n * sizeof(T));                               \
+    int* piv = (int*)malloc(n * sizeof(int));                            \
+    memcpy(LU, A, n * n * sizeof(T));                                    \
+                                                                         \
+    for (int i = 0; i < n; i++)                                          \
+        piv[i] = i;                                                      \
+                                                                         \
+    for (int k = 0; k < n; k++) {                                        \
+        T max = fabs(LU[IDX(k,k,n)]);                                    \
+        int pivot = k;                                                   \
+                                                                         \
+        for (int i = k + 1; i < n; i++) {                                \
+            T val = fabs(LU[IDX(i,k,n)]);                                \
+            if (val > max) {                                             \
+                max = val;                                               \
+                pivot = i;                                               \
+            }                                                            \
+        }                                                                \
+                                                                         \
+        if (pivot != k) {                                                \
+            for (int j = 0; j < n; j++) {                                \
+                T tmp = LU[IDX(k,j,n)];                                  \
+                LU[IDX(k,j,n)] = LU[IDX(pivot,j,n)];                     \
+                LU[IDX(pivot,j,n)] = tmp;                                \
+            }                                                            \
+            int tmp = piv[k];                                            \
+            piv[k] = piv[pivot];                                         \
+            piv[pivot] = tmp;                                            \
+        }                                                                \
+                                                                         \
+        T diag = LU[IDX(k,k,n)];                                         \
+                                                                         \
+        _Pragma("omp parallel for if(use_OMP)")                          \
+        for (int i = k + 1; i < n; i++) {                                \
+            LU[IDX(i,k,n)] /= diag;                                      \
+            T mult = LU[IDX(i,k,n)];                                     \
+            for (int j = k + 1; j < n; j++)                              \
+                LU[IDX(i,j,n)] -= mult * LU[IDX(k,j,n)];                 \
+        }                                                                \
+    }                                                                    \
+                                                                         \
+    _Pragma("omp parallel for if(use_OMP)")                              \
+    for (int col = 0; col < n; col++) {                                  \
+        T* x = (T*)malloc(n * sizeof(T));                                \
+        for (int i = 0; i < n; i++)                                      \
+            x[i] = (piv[i] == col) ? 1 : 0;                              \
+                                                                         \
+        for (int i = 0; i < n; i++) {                                    \
+            for (int j = 0; j < i; j++)                                  \
+                x[i] -= LU[IDX(i,j,n)] * x[j];                           \
+        }                                                                \
+                                                                         \
+        for (int i = n - 1; i >= 0; i--) {                               \
+            for (int j = i + 1; j < n; j++)                              \
+                x[i] -= LU[IDX(i,j,n)] * x[j];                           \
+            x[i] /= LU[IDX(i,i,n)];                                      \
+        }                                                                \
+                                                                         \
+        for (int i = 0; i < n; i++)                                      \
+            invA[IDX(i,col,n)] = x[i];                                   \
+                                                                         \
+        free(x);                                                         \
+    }                                                                    \
+                                                                         \
+    free(LU);                                                            \
+    free(piv);                                                           \
+}
+
+FOR_EACH_FLOAT_DTYPE(DEFINE_MAT_INV)
+
+/*
+ * Integer matrix power by binary exponentiation. The running product and the
+ * repeated square each ping-pong between two preallocated buffers, so A^k
+ * costs O(log k) mat_mul calls and a single allocation. Negative powers are
+ * handled in Python by inverting first. Returns -1 if the allocation fails.
+ */
+#define DEFINE_MAT_POW(SFX, T)                                           \
+int mat_pow_##SFX(const T* A, T* C, size_t n, uint64_t k, int use_OMP)   \
+{                                                                        \
+    const size_t size = n * n;                                           \
+    if (k == 0) {                                                        \
+        memset(C, 0, size * sizeof(T));                                  \
+        for (size_t i = 0; i < n; i++)                                   \
+            C[i*n + i] = 1;                                              \
+        return 0;                                                        \
+    }                                                                    \
+                                                                         \
+    T* scratch = malloc(3 * size * sizeof(T));                           \
+    if (!scratch) return -1;                                             \
+    T* res[2] = { C, scratch };                                          \
+    T* sq[2] = { scratch + size, scratch + 2*size };                     \
+    int r = 0, s = 0, have = 0;                                          \
+    memcpy(sq[0], A, size * sizeof(T));                                  \
+                                                                         \
+    for (;;) {                                                           \
+        if (k & 1) {                                                     \
+            if (have) {                                                  \
+                mat_mul_##SFX(res[r], sq[s], res[r ^ 1], n, n, n, use_OMP); \
+                r ^= 1;                                                  \
+            } else {                                                     \
+                memcpy(res[r], sq[s], size * sizeof(T));                 \
+                have = 1;                                                \
+            }                                                            \
+        }                                                                \
+        k >>= 1;                                                         \
+        if (!k) break;                                                   \
+        mat_mul_##SFX(sq[s], sq[s], sq[s ^ 1], n, n, n, use_OMP);        \
+        s ^= 1;                                                          \
+    }                                                                    \
+                                                                         \
+    if (res[r] != C)                                                     \
+        memcpy(C, res[r], size * sizeof(T));                             \
+    free(scratch);                                                       \
+    return 0;                                                            \
+}
+
+FOR_EACH_DTYPE(DEFINE_MAT_POW)
+
+/*
+ * Matrix exponential by scaling and squaring (Higham 2005). A is scaled by
+ * 2^-s until its 1-norm is below the threshold of the chosen [m/m] Padé
+ * degree, r(A) = (V - U)^-1 (V + U) is evaluated with the mat_mul kernel and
+ * an LU solve, and the result is squared s times. Always computed in double;
+ * a non-finite input gives a matrix of NaN.
+ */
+static const int expm_degrees[5] = { 3, 5, 7, 9, 13 };
+static const double expm_thetas[5] = {
+    1.495585217958292e-2, 2.539398330063230e-1, 9.504178996162932e-1,
+    2.097847961257068e0, 5.371920351148152e0,
+};
+
+static void pade_coefficients(int m, double* b)
 {
-    double* LU = (double*)malloc(n * n * sizeof(double));
-    int* piv = (int*)malloc(n * sizeof(int));
-    memcpy(LU, A, n * n * sizeof(double));
+    b[0] = 1.0;
+    for (int j = 1; j <= m; j++)
+        b[j] = b[j-1] * (double)(m - j + 1) / ((double)j * (double)(2*m - j + 1));
+}
 
-    for (int i = 0; i < n; i++)
-        piv[i] = i;
+static double norm1(const double* A, size_t n)
+{
+    double norm = 0.0;
+    for (size_t j = 0; j < n; j++) {
+        double col = 0.0;
+        for (size_t i = 0; i < n; i++)
+            col += fabs(A[i*n + j]);
+        if (isnan(col))
+            return col;
+        if (col > norm)
+            norm = col;
+    }
+    return norm;
+}
 
-    for (int k = 0; k < n; k++) {
-        double max = fabs(LU[IDX(k,k,n)]);
-        int pivot = k;
+/* out (+)= sum coef[j] * mats[j] + diag * I */
+static void lincomb(double* out, int accumulate, const double* const* mats, const double* coef,
+                    int count, double diag, size_t n, int use_OMP)
+{
+    const size_t size = n * n;
+    #pragma omp parallel for simd if(parallel: use_OMP)
+    for (size_t i = 0; i < size; i++) {
+        double v = accumulate ? out[i] : 0.0;
+        for (int j = 0; j < count; j++)
+            v += coef[j] * mats[j][i];
+        out[i] = v;
+    }
+    for (size_t i = 0; i < n; i++)
+        out[i*n + i] += diag;
+}
 
-        for (int i = k + 1; i < n; i++) {
-            double val = fabs(LU[IDX(i,k,n)]);
-            if (val > max) {
-                max = val;
+/* Solve M X = B in place (B becomes X) by LU with partial pivoting; -1 if M is singular. */
+static int solve_inplace(double* M, double* B, size_t n, int use_OMP)
+{
+    for (size_t k = 0; k < n; k++) {
+        size_t pivot = k;
+        for (size_t i = k + 1; i < n; i++)
+            if (fabs(M[i*n + k]) > fabs(M[pivot*n + k]))
                 pivot = i;
-            }
-        }
+        if (M[pivot*n + k] == 0.0)
+            return -1;
 
         if (pivot != k) {
-            for (int j = 0; j < n; j++) {
-                double tmp = LU[IDX(k,j,n)];
-                LU[IDX(k,j,n)] = LU[IDX(pivot,j,n)];
-                LU[IDX(pivot,j,n)] = tmp;
+            for (size_t j = 0; j < n; j++) {
+                double t = M[k*n + j]; M[k*n + j] = M[pivot*n + j]; M[pivot*n + j] = t;
+                t = B[k*n + j]; B[k*n + j] = B[pivot*n + j]; B[pivot*n + j] = t;
             }
-            int tmp = piv[k];
-            piv[k] = piv[pivot];
-            piv[pivot] = tmp;
         }
 
-        double diag = LU[IDX(k,k,n)];
-
+        const double diag = M[k*n + k];
         #pragma omp parallel for if(use_OMP)
-        for (int i = k + 1; i < n; i++) {
-            LU[IDX(i,k,n)] /= diag;
-            double mult = LU[IDX(i,k,n)];
-            for (int j = k + 1; j < n; j++)
-                LU[IDX(i,j,n)] -= mult * LU[IDX(k,j,n)];
+        for (size_t i = k + 1; i < n; i++) {
+            const double f = M[i*n + k] / diag;
+            if (f == 0.0) continue;
+            #pragma omp simd
+            for (size_t j = k + 1; j < n; j++)
+                M[i*n + j] -= f * M[k*n + j];
+            #pragma omp simd
+            for (size_t j = 0; j < n; j++)
+                B[i*n + j] -= f * B[k*n + j];
         }
     }
 
-    #pragma omp parallel for if(use_OMP)
-    for (int col = 0; col < n; col++) {
-        double* x = (double*)calloc(n, sizeof(double));
-        x[col] = 1.0;
+    for (size_t k = n; k-- > 0;) {
+        double* row = B + k*n;
+        for (size_t j = k + 1; j < n; j++) {
+            const double f = M[k*n + j];
+            const double* other = B + j*n;
+            #pragma omp simd
+            for (size_t c = 0; c < n; c++)
+                row[c] -= f * other[c];
+        }
+        const double diag = M[k*n + k];
+        #pragma omp simd
+        for (size_t c = 0; c < n; c++)
+            row[c] /= diag;
+    }
+    return 0;
+}
 
-        double* x_perm = (double*)malloc(n * sizeof(double));
-        for (int i = 0; i < n; i++)
-            x_perm[i] = x[piv[i]];
-        free(x);
-        x = x_perm;
+static int expm_double(const double* A, double* E, size_t n, int use_OMP)
+{
+    const size_t size = n * n;
+    const double norm = norm1(A, n);
+    if (!isfinite(norm)) {
+        for (size_t i = 0; i < size; i++)
+            E[i] = NAN;
+        return 0;
+    }
 
-        for (int i = 0; i < n; i++) {
-            for (int j = 0; j < i; j++)
-                x[i] -= LU[IDX(i,j,n)] * x[j];
-        }
+    int idx = 0, s = 0;
+    while (idx < 4 && norm > expm_thetas[idx])
+        idx++;
+    if (idx == 4 && norm > expm_thetas[4])
+        s = (int)ceil(log2(norm / expm_thetas[4]));
+    const int m = expm_degrees[idx];
+    double b[14];
+    pade_coefficients(m, b);
+
+    double* work = malloc(8 * size * sizeof(double));
+    if (!work) return -1;
+    double* X = work;
+    double* P[4] = { work + size, work + 2*size, work + 3*size, work + 4*size };
+    double* U = work + 5*size;
+    double* V = work + 6*size;
+    double* T = work + 7*size;
+
+    for (size_t i = 0; i < size; i++)
+        X[i] = ldexp(A[i], -s);
+
+    /* Even powers A^2, A^4, ... (13 only needs up to A^6) */
+    const int npow = m == 13 ? 3 : (m - 1) / 2;
+    mat_mul_f64(X, X, P[0], n, n, n, use_OMP);
+    for (int j = 1; j < npow; j++)
+        mat_mul_f64(P[j-1], P[0], P[j], n, n, n, use_OMP);
+
+    if (m == 13) {
+        const double* hi[3] = { P[2], P[1], P[0] };
+        const double u_hi[3] = { b[13], b[11], b[9] }, u_lo[3] = { b[7], b[5], b[3] };
+        const double v_hi[3] = { b[12], b[10], b[8] }, v_lo[3] = { b[6], b[4], b[2] };
 
-        for (int i = n - 1; i >= 0; i--) {
-            for (int j = i + 1; j < n; j++)
-                x[i] -= LU[IDX(i,j,n)] * x[j];
-            x[i] /= LU[IDX(i,i,n)];
+        lincomb(T, 0, hi, u_hi, 3, 0.0, n, use_OMP);
+        mat_mul_f64(P[2], T, V, n, n, n, use_OMP);
+        lincomb(V, 1, hi, u_lo, 3, b[1], n, use_OMP);
+        mat_mul_f64(X, V, U, n, n, n, use_OMP);
+
+        lincomb(T, 0, hi, v_hi, 3, 0.0, n, use_OMP);
+        mat_mul_f64(P[2], T, V, n, n, n, use_OMP);
+        lincomb(V, 1, hi, v_lo, 3, b[0], n, use_OMP);
+    } else {
+        const double* powers[4] = { P[0], P[1], P[2], P[3] };
+        double odd[4], even[4];
+        for (int j = 0; j < npow; j++) {
+            odd[j] = b[2*j + 3];
+            even[j] = b[2*j + 2];
         }
+        lincomb(T, 0, powers, odd, npow, b[1], n, use_OMP);
+        mat_mul_f64(X, T, U, n, n, n, use_OMP);
+        lincomb(V, 0, powers, even, npow, b[0], n, use_OMP);
+    }
 
-        for (int i = 0; i < n; i++)
-            invA[IDX(i,col,n)] = x[i];
+    /* (V - U) R = (V + U), with R written to E */
+    #pragma omp parallel for simd if(parallel: use_OMP)
+    for (size_t i = 0; i < size; i++) {
+        const double u = U[i], v = V[i];
+        V[i] = v - u;
+        E[i] = v + u;
+    }
+    if (solve_inplace(V, E, n, use_OMP) != 0) {
+        for (size_t i = 0; i < size; i++)
+            E[i] = NAN;
+        free(work);
+        return 0;
+    }
 
-        free(x);
+    double* cur = E;
+    double* next = T;
+    for (int i = 0; i < s; i++) {
+        mat_mul_f64(cur, cur, next, n, n, n, use_OMP);
+        double* t = cur; cur = next; next = t;
     }
+    if (cur != E)
+        memcpy(E, cur, size * sizeof(double));
+
+    free(work);
+    return 0;
+}
+
+#define DEFINE_MAT_EXPM(SFX, T)                                          \
+int mat_expm_##SFX(const T* A, T* E, size_t n, int use_OMP)              \
+{                                                                        \
+    const size_t size = n * n;                                           \
+    if (size == 0) return 0;                                             \
+    double* work = malloc(2 * size * sizeof(double));                    \
+    if (!work) return -1;                                                \
+    for (size_t i = 0; i < size; i++)                                    \
+        work[i] = A[i];                                                  \
+                                                                         \
+    int status = expm_double(work, work + size, n, use_OMP);             \
+    for (size_t i = 0; i < size; i++)                                    \
+        E[i] = (T)work[size + i];                                        \
+                                                                         \
+    free(work);                                                          \
+    return status;                                                       \
+}
 
-    free(LU);
-    free(piv);
-}
\ No newline at end of file
+FOR_EACH_FLOAT_DTYPE(DEFINE_MAT_EXPM)
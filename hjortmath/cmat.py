@@ -2,13 +2,26 @@
 Python wrapper for libcmat.so
 
 Provides matrix operations backed by C for speed.
-Matrices are flattened row-major lists of doubles.
+Matrices are flattened row-major arrays (array.array) of one of the
+supported dtypes; every kernel exists once per dtype in the library.
 
-All functions return a new Python list.
+All functions return a new array.array. Inputs that already are storage
+arrays of the right dtype are handed to C without copying.
+
+The library is loaded lazily, on the first kernel call (or backend_info()).
+If it is missing, built for another architecture or out of date, a
+RuntimeWarning is issued once and every function here runs its pure
+Python counterpart from pykernels.py instead.
 """
 
 from .imports import *
 from .customdecorators import alias
+from .dtypes import DType, DTYPES, int64, resolve_dtype, dtype_of, as_storage
+from . import pykernels
+from .pykernels import (
+    FLOAT_UFUNCS, UFUNCS, PARAM_UFUNCS,
+    ufunc_dtype, broadcast_shape, broadcast_strides,
+)
 
 
 if TYPE_CHECKING:
@@ -16,178 +29,460 @@ if TYPE_CHECKING:
 
 
 
-_lib = ctypes.CDLL(os.path.join(os.path.dirname(__file__), "libcmat.so"))
+LIB_PATH: str = os.path.join(os.path.dirname(__file__), "libcmat.so")
+
+_lib: Optional[ctypes.CDLL] = None
+_load_error: Optional[str] = None
+_load_attempted: bool = False
+_load_lock = threading.Lock()
 
+_PTR = object()      # placeholder: pointer to the kernel's element type
+_SCALAR = object()   # placeholder: one element of the kernel's element type
 
+_DECLARATIONS: List[Tuple[str, Any, List[Any], Optional[Tuple[DType, ...]]]] = []
 
 
+def _declare(name: str, restype: Any, argtypes: List[Any], dtypes: Optional[Tuple[DType, ...]] = DTYPES) -> None:
+    """
+    Record argtypes/restype for every dtype variant (name_f32, name_f64, ...)
+    of a kernel, or for the bare symbol when dtypes is None. Applied on load.
+    """
+    _DECLARATIONS.append((name, restype, argtypes, dtypes))
+
 
-_lib.mat_add.argtypes = [
-    ctypes.POINTER(ctypes.c_double),  # A
-    ctypes.POINTER(ctypes.c_double),  # B
-    ctypes.POINTER(ctypes.c_double),  # C (output)
-    ctypes.c_size_t,                  # size
-    ctypes.c_int                      # use_OMP
+def _bind(lib: ctypes.CDLL) -> None:
+    """Apply every recorded declaration; raises AttributeError on a missing symbol"""
+    for name, restype, argtypes, dtypes in _DECLARATIONS:
+        for dtype in (dtypes if dtypes is not None else (None,)):
+            func = getattr(lib, name if dtype is None else f"{name}_{dtype.suffix}")
+            func.argtypes = [
+                ctypes.POINTER(dtype.ctype) if arg is _PTR else dtype.ctype if arg is _SCALAR else arg
+                for arg in argtypes
+            ]
+            func.restype = restype
+
+
+def _load() -> Optional[ctypes.CDLL]:
+    """Load and bind libcmat.so on first use; None if it is unusable"""
+    global _lib, _load_error, _load_attempted
+    if _load_attempted:
+        return _lib
+
+    with _load_lock:
+        if _load_attempted:
+            return _lib
+        try:
+            lib = ctypes.CDLL(LIB_PATH)
+            _bind(lib)
+            _lib = lib
+        except OSError as exc:
+            _load_error = str(exc)
+        except AttributeError as exc:
+            _load_error = f"{LIB_PATH} is out of date ({exc}); rebuild it with make"
+        _load_attempted = True
+
+    if _lib is None:
+        warnings.warn(
+            f"hjortmath: native backend unavailable, falling back to pure Python kernels ({_load_error})",
+            RuntimeWarning,
+            stacklevel=3,
+        )
+    return _lib
+
+
+def _native_or(fallback: Callable) -> Callable:
+    """Run the pure Python kernel `fallback` instead when the library cannot be loaded"""
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if _lib is None and _load() is None:
+                return fallback(*args, **kwargs)
+            return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def native_available() -> bool:
+    """True if libcmat.so loaded (loading it if that has not happened yet)"""
+    return _load() is not None
+
+
+def backend_info() -> dict:
+    """
+    Describe the active backend: "native" or "python", the library path, the
+    load error if any, and what the library was built with (OpenMP version,
+    max thread count, SIMD instruction set).
+    """
+    lib = _load()
+    if lib is None:
+        return {
+            "backend": "python", "library": LIB_PATH, "error": _load_error,
+            "openmp": False, "openmp_version": 0, "threads": 1, "simd": None,
+        }
+
+    openmp_version = lib.cmat_openmp_version()
+    return {
+        "backend": "native", "library": LIB_PATH, "error": None,
+        "openmp": openmp_version > 0, "openmp_version": openmp_version,
+        "threads": lib.cmat_max_threads(), "simd": lib.cmat_simd_level().decode(),
+    }
+
+
+_declare("cmat_openmp_version", ctypes.c_int, [], None)
+
+_declare("cmat_max_threads", ctypes.c_int, [], None)
+
+_declare("cmat_simd_level", ctypes.c_char_p, [], None)
+
+
+_FLOAT_DTYPES: Tuple[DType, ...] = tuple(d for d in DTYPES if d.is_float)
+
+_declare("mat_add", None, [
+    _PTR,              # A
+    _PTR,              # B
+    _PTR,              # C (output)
+    ctypes.c_size_t,  # size
+    ctypes.c_int      # use_OMP
+])
+
+_declare("mat_sub", None, [_PTR, _PTR, _PTR, ctypes.c_size_t, ctypes.c_int])
+
+_declare("hadamard", None, [_PTR, _PTR, _PTR, ctypes.c_size_t, ctypes.c_int])
+
+_BCAST_ARGTYPES: List[Any] = [
+    _PTR,             # A
+    ctypes.c_size_t,  # A row stride (0 = broadcast along rows)
+    ctypes.c_size_t,  # A column stride (0 = broadcast along columns)
+    _PTR,             # B
+    ctypes.c_size_t,  # B row stride
+    ctypes.c_size_t,  # B column stride
+    _PTR,             # C (output, m x n)
+    ctypes.c_size_t,  # m
+    ctypes.c_size_t,  # n
+    ctypes.c_int      # use_OMP
 ]
-_lib.mat_add.restype = None
 
+_declare("mat_add_bcast", None, _BCAST_ARGTYPES)
+
+_declare("mat_sub_bcast", None, _BCAST_ARGTYPES)
+
+_declare("hadamard_bcast", None, _BCAST_ARGTYPES)
+
+_declare("mat_div_bcast", None, _BCAST_ARGTYPES, _FLOAT_DTYPES)
+
+for _name in FLOAT_UFUNCS + UFUNCS:
+    if _name in PARAM_UFUNCS:
+        _argtypes = [_PTR, _SCALAR, _SCALAR, _PTR, ctypes.c_size_t, ctypes.c_int]  # A, a, b, C, size, use_OMP
+    else:
+        _argtypes = [_PTR, _PTR, ctypes.c_size_t, ctypes.c_int]                    # A, C, size, use_OMP
+    _declare(f"mat_{_name}", None, _argtypes, _FLOAT_DTYPES if _name in FLOAT_UFUNCS else DTYPES)
+del _name, _argtypes
+
+_declare("mat_minmax", None, [
+    _PTR,             # A
+    ctypes.c_size_t,  # size
+    _PTR,             # out: [min, max]
+    ctypes.c_int      # use_OMP
+])
+
+_declare("mat_random_uniform", None, [
+    _PTR,             # C (output)
+    ctypes.c_size_t,  # size
+    ctypes.c_uint64,  # seed
+    ctypes.c_double,  # low
+    ctypes.c_double,  # high
+    ctypes.c_int      # use_OMP
+], _FLOAT_DTYPES)
 
-_lib.mat_sub.argtypes = [
-    ctypes.POINTER(ctypes.c_double),
-    ctypes.POINTER(ctypes.c_double),
-    ctypes.POINTER(ctypes.c_double),
+_declare("mat_random_normal", None, [
+    _PTR,
     ctypes.c_size_t,
+    ctypes.c_uint64,
+    ctypes.c_double,  # mean
+    ctypes.c_double,  # std
     ctypes.c_int
-]
-_lib.mat_sub.restype = None
-
+], _FLOAT_DTYPES)
 
-_lib.hadamard.argtypes = [
-    ctypes.POINTER(ctypes.c_double),
-    ctypes.POINTER(ctypes.c_double),
-    ctypes.POINTER(ctypes.c_double),
+_declare("mat_random_integers", None, [
+    _PTR,
     ctypes.c_size_t,
+    ctypes.c_uint64,
+    ctypes.c_int64,   # low (inclusive)
+    ctypes.c_int64,   # high (exclusive)
     ctypes.c_int
-]
-_lib.hadamard.restype = None
+], tuple(d for d in DTYPES if not d.is_float))
 
-_lib.mat_mul.argtypes = [
-    ctypes.POINTER(ctypes.c_double),
-    ctypes.POINTER(ctypes.c_double),
-    ctypes.POINTER(ctypes.c_double),
+_declare("mat_mul", None, [
+    _PTR,
+    _PTR,
+    _PTR,
     ctypes.c_size_t,
     ctypes.c_size_t,
     ctypes.c_size_t,
     ctypes.c_int
-]
-_lib.mat_mul.restype = None
+])
 
+_declare("scalar_mul", None, [_PTR, _SCALAR, _PTR, ctypes.c_size_t, ctypes.c_int])
 
-_lib.scalar_mul.argtypes = [
-    ctypes.POINTER(ctypes.c_double),
-    ctypes.c_double,
-    ctypes.POINTER(ctypes.c_double),
-    ctypes.c_size_t,
-    ctypes.c_int
-]
-_lib.scalar_mul.restype = None
+_declare("mat_det", ctypes.c_double, [_PTR, ctypes.c_size_t, ctypes.c_int], _FLOAT_DTYPES)
 
+_declare("mat_inv", None, [_PTR, _PTR, ctypes.c_int, ctypes.c_int], _FLOAT_DTYPES)
 
-_lib.mat_det.argtypes = [
-    ctypes.POINTER(ctypes.c_double), 
-    ctypes.c_size_t,
-    ctypes.c_int
-]
-_lib.mat_det.restype = ctypes.c_double
+_declare("mat_pow", ctypes.c_int, [_PTR, _PTR, ctypes.c_size_t, ctypes.c_uint64, ctypes.c_int])
+
+_declare("mat_expm", ctypes.c_int, [_PTR, _PTR, ctypes.c_size_t, ctypes.c_int], _FLOAT_DTYPES)
 
-_lib.mat_inv.argtypes = [
-    ctypes.POINTER(ctypes.c_double),
-    ctypes.POINTER(ctypes.c_double),
-    ctypes.c_int,
-    ctypes.c_int
-]
-_lib.mat_inv.restype = None
 
 @alias("Help")
 class Helpers():
     @staticmethod
-    def _to_c_array(py_list):
-        """Convert Python list to ctypes array"""
-        size = len(py_list)
-        return (ctypes.c_double * size)(*py_list)
+    def _to_c_array(values, dtype=None):
+        """View storage as a ctypes array, converting to the dtype first if needed"""
+        dtype = Help._dtype_for(values, dtype)
+        storage = as_storage(values, dtype)
+        return (dtype.ctype * len(storage)).from_buffer(storage)
+
+    @staticmethod
+    def _dtype_for(values, dtype):
+        """Explicit dtype if given, otherwise the dtype of the storage"""
+        return resolve_dtype(dtype) if dtype is not None else dtype_of(values)
 
     @staticmethod
-    def _new_c_array(size):
-        """Create empty ctypes array"""
-        return (ctypes.c_double * size)()
+    def _new_c_array(size, dtype=None):
+        """Create zeroed storage and a ctypes view of it"""
+        dtype = resolve_dtype(dtype)
+        storage = array.array(dtype.typecode, bytes(size * dtype.itemsize))
+        return storage, (dtype.ctype * size).from_buffer(storage)
 
     @staticmethod
-    def _to_py_list(c_array, size):
-        """Convert ctypes array to Python list"""
-        return [c_array[i] for i in range(size)]
+    def _kernel(name, dtype):
+        """Look up the dtype variant of a kernel"""
+        return getattr(_lib, f"{name}_{dtype.suffix}")
+
+    @staticmethod
+    def _float_dtype(dtype):
+        """Dtype used by kernels that only exist for floating types"""
+        return pykernels.float_dtype(dtype)
+
 
+def _omp(use_OMP):
+    return ctypes.c_int(1 if use_OMP else 0)
 
 
-def mat_add(A, B, m=None, n=None, use_OMP=True):
+def _elementwise(name, A, B, use_OMP, dtype):
     size = len(A)
 
     if len(B) != size:
         raise ValueError("Arrays must have same length")
 
-    A_arr = Help._to_c_array(A)
-    B_arr = Help._to_c_array(B)
-    C_arr = Help._new_c_array(size)
+    dtype = Help._dtype_for(A, dtype)
+    A_arr = Help._to_c_array(A, dtype)
+    B_arr = Help._to_c_array(B, dtype)
+    C, C_arr = Help._new_c_array(size, dtype)
 
-    _lib.mat_add(A_arr, B_arr, C_arr, size, ctypes.c_int(1 if use_OMP else 0))
+    Help._kernel(name, dtype)(A_arr, B_arr, C_arr, size, _omp(use_OMP))
 
-    return Help._to_py_list(C_arr, size)
+    return C
 
 
-def mat_sub(A, B, m=None, n=None, use_OMP=True):
-    size = len(A)
+@_native_or(pykernels.mat_add)
+def mat_add(A, B, m=None, n=None, use_OMP=True, dtype=None):
+    return _elementwise("mat_add", A, B, use_OMP, dtype)
 
-    if len(B) != size:
-        raise ValueError("Arrays must have same length")
 
-    A_arr = Help._to_c_array(A)
-    B_arr = Help._to_c_array(B)
-    C_arr = Help._new_c_array(size)
+@_native_or(pykernels.mat_sub)
+def mat_sub(A, B, m=None, n=None, use_OMP=True, dtype=None):
+    return _elementwise("mat_sub", A, B, use_OMP, dtype)
 
-    _lib.mat_sub(A_arr, B_arr, C_arr, size, ctypes.c_int(1 if use_OMP else 0))
 
-    return Help._to_py_list(C_arr, size)
+@_native_or(pykernels.hadamard)
+def hadamard(A, B, m=None, n=None, use_OMP=True, dtype=None):
+    return _elementwise("hadamard", A, B, use_OMP, dtype)
 
 
-def hadamard(A, B, m=None, n=None, use_OMP=True):
-    size = len(A)
+@_native_or(pykernels.broadcast_op)
+def broadcast_op(name, A, a_shape, B, b_shape, use_OMP=True, dtype=None):
+    """
+    Elementwise `name` (mat_add, mat_sub, hadamard, mat_div) with NumPy-style
+    broadcasting of scalars (1x1), row vectors (1xn) and column vectors (mx1).
+    The smaller operand is read in place through zero strides.
+    """
+    out_shape = broadcast_shape(a_shape, b_shape)
+    if out_shape is None:
+        raise ValueError(f"Shapes {a_shape} and {b_shape} cannot be broadcast together")
 
-    if len(B) != size:
-        raise ValueError("Arrays must have same length")
+    dtype = Help._dtype_for(A, dtype)
+    if name == "mat_div":
+        dtype = Help._float_dtype(dtype)
+
+    m, n = out_shape
+    a_rs, a_cs = broadcast_strides(a_shape, out_shape)
+    b_rs, b_cs = broadcast_strides(b_shape, out_shape)
+
+    A_arr = Help._to_c_array(A, dtype)
+    B_arr = Help._to_c_array(B, dtype)
+    C, C_arr = Help._new_c_array(m * n, dtype)
+
+    Help._kernel(f"{name}_bcast", dtype)(A_arr, a_rs, a_cs, B_arr, b_rs, b_cs, C_arr, m, n, _omp(use_OMP))
+
+    return C
+
+@_native_or(pykernels.unary_op)
+def unary_op(name, A, *params, use_OMP=True, dtype=None, out=None):
+    """
+    Apply the ufunc `name` (exp, log, sqrt, tanh, sigmoid, abs, power, clip,
+    gt, ge, lt, le, eq, ne) elementwise. `params` are the scalar arguments of
+    power (exponent), clip (low, high) and the comparisons (threshold).
+    Passing `out=A` runs the kernel in place.
+    """
+    size = len(A)
+    dtype = ufunc_dtype(name, Help._dtype_for(A, dtype))
 
-    A_arr = Help._to_c_array(A)
-    B_arr = Help._to_c_array(B)
-    C_arr = Help._new_c_array(size)
+    A_arr = Help._to_c_array(A, dtype)
+    if out is None:
+        C, C_arr = Help._new_c_array(size, dtype)
+    else:
+        C, C_arr = out, Help._to_c_array(out)
+        if dtype_of(out) is not dtype or len(out) != size:
+            raise TypeError(f"Output storage must be {size} entries of {dtype}")
 
-    _lib.hadamard(A_arr, B_arr, C_arr, size, ctypes.c_int(1 if use_OMP else 0))
+    params, fill = pykernels.fit_params(name, params, dtype)
+    if fill is not None:
+        C[:] = as_storage([fill] * size, dtype)
+        return C
 
-    return Help._to_py_list(C_arr, size)
+    args = [A_arr]
+    if name in PARAM_UFUNCS:
+        a, b = (list(params) + [0, 0])[:2]
+        args += [dtype.ctype(dtype.cast(a)), dtype.ctype(dtype.cast(b))]
 
-def mat_mul(A, B, m, n, p, use_OMP=True):
-    A_arr = Help._to_c_array(A)
-    B_arr = Help._to_c_array(B)
-    C_arr = Help._new_c_array(m*p)
+    Help._kernel(f"mat_{name}", dtype)(*args, C_arr, size, _omp(use_OMP))
 
-    _lib.mat_mul(A_arr, B_arr, C_arr, m, n, p, ctypes.c_int(1 if use_OMP else 0))
-    return Help._to_py_list(C_arr, m*p)
+    return C
 
-def scalar_mul(A, scalar, m=None, n=None, use_OMP=True):
+@_native_or(pykernels.mat_minmax)
+def mat_minmax(A, use_OMP=True, dtype=None):
+    """Smallest and largest entry in one parallel pass"""
     size = len(A)
+    if size == 0:
+        raise ValueError("Cannot reduce an empty array")
+
+    dtype = Help._dtype_for(A, dtype)
+    A_arr = Help._to_c_array(A, dtype)
+    out, out_arr = Help._new_c_array(2, dtype)
+
+    Help._kernel("mat_minmax", dtype)(A_arr, size, out_arr, _omp(use_OMP))
+
+    return out[0], out[1]
+
+def _random(kernel, size, seed, a, b, use_OMP, dtype):
+    C, C_arr = Help._new_c_array(size, dtype)
+    Help._kernel(kernel, dtype)(C_arr, size, ctypes.c_uint64(seed % 2**64), a, b, _omp(use_OMP))
+    return C
+
+@_native_or(pykernels.random_uniform)
+def random_uniform(size, seed, low=0.0, high=1.0, use_OMP=True, dtype=None):
+    """`size` uniform samples in [low, high); entry i depends only on (seed, i)"""
+    return _random("mat_random_uniform", size, seed, low, high, use_OMP, resolve_dtype(dtype))
+
+@_native_or(pykernels.random_normal)
+def random_normal(size, seed, mean=0.0, std=1.0, use_OMP=True, dtype=None):
+    """`size` normal samples (Box-Muller); entry i depends only on (seed, i)"""
+    return _random("mat_random_normal", size, seed, mean, std, use_OMP, resolve_dtype(dtype))
+
+@_native_or(pykernels.random_integers)
+def random_integers(size, seed, low, high, use_OMP=True, dtype=None):
+    """`size` integers in [low, high); entry i depends only on (seed, i)"""
+    dtype = resolve_dtype(dtype if dtype is not None else int64)
+    pykernels.check_integer_bounds(low, high, dtype)
+    return _random("mat_random_integers", size, seed, low, high - 1, use_OMP, dtype)
+
+@_native_or(pykernels.mat_mul)
+def mat_mul(A, B, m, n, p, use_OMP=True, dtype=None):
+    dtype = Help._dtype_for(A, dtype)
+    A_arr = Help._to_c_array(A, dtype)
+    B_arr = Help._to_c_array(B, dtype)
+    C, C_arr = Help._new_c_array(m*p, dtype)
+
+    Help._kernel("mat_mul", dtype)(A_arr, B_arr, C_arr, m, n, p, _omp(use_OMP))
+    return C
+
+@_native_or(pykernels.scalar_mul)
+def scalar_mul(A, scalar, m=None, n=None, use_OMP=True, dtype=None):
+    size = len(A)
+    dtype = Help._dtype_for(A, dtype)
 
-    A_arr = Help._to_c_array(A)
-    C_arr = Help._new_c_array(size)
+    A_arr = Help._to_c_array(A, dtype)
+    C, C_arr = Help._new_c_array(size, dtype)
 
-    _lib.scalar_mul(A_arr, ctypes.c_double(scalar), C_arr, size, ctypes.c_int(1 if use_OMP else 0))
+    Help._kernel("scalar_mul", dtype)(A_arr, dtype.ctype(dtype.cast(scalar)), C_arr, size, _omp(use_OMP))
 
-    return Help._to_py_list(C_arr, size)
+    return C
 
 
-def mat_det(A, n, use_OMP=True):
+@_native_or(pykernels.mat_det)
+def mat_det(A, n, use_OMP=True, dtype=None):
     if len(A) != n * n:
         raise ValueError("Matrix list size does not match provided dimensions.")
 
-    A_arr = Help._to_c_array(A)
-    
-    result = _lib.mat_det(A_arr, n, ctypes.c_int(1 if use_OMP else 0))
-    
+    dtype = Help._float_dtype(Help._dtype_for(A, dtype))
+    A_arr = Help._to_c_array(A, dtype)
+
+    result = Help._kernel("mat_det", dtype)(A_arr, n, _omp(use_OMP))
+
     return float(result)
 
-def mat_inv(A, n, use_OMP=True):
+@_native_or(pykernels.mat_inv)
+def mat_inv(A, n, use_OMP=True, dtype=None):
+    if len(A) != n * n:
+        raise ValueError("Matrix list size does not match provided dimensions.")
+
+    dtype = Help._float_dtype(Help._dtype_for(A, dtype))
+    A_arr = Help._to_c_array(A, dtype)
+    C, C_arr = Help._new_c_array(n * n, dtype)
+
+    Help._kernel("mat_inv", dtype)(A_arr, C_arr, ctypes.c_int(n), _omp(use_OMP))
+
+    return C
+
+@_native_or(pykernels.mat_pow)
+def mat_pow(A, n, k, use_OMP=True, dtype=None):
+    """A^k for k >= 0 by binary exponentiation in a single native call"""
     if len(A) != n * n:
         raise ValueError("Matrix list size does not match provided dimensions.")
+    if k < 0:
+        raise ValueError(f"Power must be non-negative (got {k}); invert the matrix first")
+
+    dtype = Help._dtype_for(A, dtype)
+    if k >= 2**64:
+        # The kernel takes a uint64 exponent: split k = high * 2**64 + low, with A^(2^64) = (A^(2^32))^(2^32)
+        high, low = divmod(k, 2**64)
+        step = mat_pow(mat_pow(A, n, 2**32, use_OMP, dtype), n, 2**32, use_OMP, dtype)
+        result = mat_pow(step, n, high, use_OMP, dtype)
+        if low == 0:
+            return result
+        return mat_mul(result, mat_pow(A, n, low, use_OMP, dtype), n, n, n, use_OMP, dtype)
+
+    A_arr = Help._to_c_array(A, dtype)
+    C, C_arr = Help._new_c_array(n * n, dtype)
+
+    if Help._kernel("mat_pow", dtype)(A_arr, C_arr, n, ctypes.c_uint64(k), _omp(use_OMP)) != 0:
+        raise MemoryError("mat_pow could not allocate its work buffers")
+
+    return C
+
+@_native_or(pykernels.mat_expm)
+def mat_expm(A, n, use_OMP=True, dtype=None):
+    """Matrix exponential by scaling and squaring with a Padé approximant"""
+    if len(A) != n * n:
+        raise ValueError("Matrix list size does not match provided dimensions.")
+
+    dtype = Help._float_dtype(Help._dtype_for(A, dtype))
+    A_arr = Help._to_c_array(A, dtype)
+    C, C_arr = Help._new_c_array(n * n, dtype)
 
-    A_arr = Help._to_c_array(A)
-    C_arr = Help._new_c_array(n * n)
+    if Help._kernel("mat_expm", dtype)(A_arr, C_arr, n, _omp(use_OMP)) != 0:
+        raise MemoryError("mat_expm could not allocate its work buffers")
 
-    _lib.mat_inv(A_arr, C_arr, ctypes.c_int(n), ctypes.c_int(1 if use_OMP else 0))
+    return C
 
-    return Help._to_py_list(C_arr, n * n)
\ No newline at end of file
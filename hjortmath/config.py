@@ -0,0 +1,94 @@
+# src/config.py
+"""
+Shared, immutable Matrix options.
+
+Every Matrix holds a reference to one MatrixConfig instead of carrying its
+own copy of each flag. Configs are interned, so all matrices created with
+the same options share a single object, and results of an operation simply
+reuse their operand's config.
+
+Matrices created without explicit options take the calling thread's
+default, which config_context() overrides for the duration of a block.
+"""
+
+from .imports import *
+
+
+class MatrixConfig(NamedTuple):
+    """
+    OPTIONS SHARED BY EVERY MATRIX CREATED WITH THE SAME SETTINGS.
+    """
+
+    use_C: bool = True
+    force_C: bool = False
+    use_color: bool = True
+    sig_digits: int = 4
+    disable_perf_hints: bool = False
+    multithreaded: bool = True
+
+    def replace(self, **options: Any) -> "MatrixConfig":
+        """RETURN THE INTERNED CONFIG WITH SOME OPTIONS CHANGED"""
+        return intern_config(self._replace(**options))
+
+    def __reduce__(self) -> Tuple[Callable[..., "MatrixConfig"], Tuple[Any, ...]]:
+        """UNPICKLE TO THE INTERNED INSTANCE SO MATRICES KEEP SHARING ONE CONFIG"""
+        return _restore_config, tuple(self)
+
+
+# Constructor keyword -> config field (disable_warnings predates the field name)
+KWARG_FIELDS: Dict[str, str] = {
+    "use_C": "use_C",
+    "force_C": "force_C",
+    "use_color": "use_color",
+    "sig_digits": "sig_digits",
+    "disable_warnings": "disable_perf_hints",
+    "disable_perf_hints": "disable_perf_hints",
+    "multithreaded": "multithreaded",
+}
+
+DEFAULT_CONFIG: MatrixConfig = MatrixConfig()
+
+_interned: Dict[MatrixConfig, MatrixConfig] = {DEFAULT_CONFIG: DEFAULT_CONFIG}
+_local = threading.local()
+
+
+def intern_config(config: MatrixConfig) -> MatrixConfig:
+    """Return the shared instance equal to `config`"""
+    return _interned.setdefault(config, config)
+
+
+def _restore_config(*values: Any) -> MatrixConfig:
+    """Unpickling hook for MatrixConfig"""
+    return intern_config(MatrixConfig(*values))
+
+
+def get_default_config() -> MatrixConfig:
+    """Config used by matrices created in this thread without explicit options"""
+    return getattr(_local, "config", DEFAULT_CONFIG)
+
+
+def config_from_kwargs(kwargs: Dict[str, Any]) -> MatrixConfig:
+    """Build (or look up) the config for Matrix constructor keywords"""
+    base: MatrixConfig = intern_config(kwargs["config"]) if kwargs.get("config") is not None else get_default_config()
+    options: Dict[str, Any] = {KWARG_FIELDS[key]: value for key, value in kwargs.items() if key in KWARG_FIELDS}
+    if not options:
+        return base
+    return base.replace(**options)
+
+
+@contextmanager
+def config_context(**options: Any) -> Iterator[MatrixConfig]:
+    """
+    Change the default options of matrices created in this thread inside
+    the block, e.g. `with config_context(use_C=False): ...`.
+    """
+    unknown: List[str] = sorted(key for key in options if key not in KWARG_FIELDS and key != "config")
+    if unknown:
+        raise TypeError(f"Unknown config option(s): {', '.join(unknown)}")
+
+    previous: MatrixConfig = get_default_config()
+    _local.config = config_from_kwargs(options)
+    try:
+        yield _local.config
+    finally:
+        _local.config = previous
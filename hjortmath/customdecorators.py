@@ -59,6 +59,10 @@ def validate_dimensions(op_type: str) -> Callable:
                 if self.m != other.m or self.n != other.n:
                     raise ValueError(f"Dimensions must match for {func.__name__}: {self.m}x{self.n} vs {other.m}x{other.n}")
             
+            elif op_type == "broadcast":
+                if any(a != b and a != 1 and b != 1 for a, b in ((self.m, other.m), (self.n, other.n))):
+                    raise ValueError(f"Dimensions cannot be broadcast for {func.__name__}: {self.m}x{self.n} vs {other.m}x{other.n}")
+            
             elif op_type == "matmul":
                 if self.n != other.m:
                     raise ValueError(f"Incompatible dimensions for multiplication: {self.n} != {other.m}")
@@ -71,13 +75,13 @@ def performance_warning(threshold: int = 50_000) -> Callable:
     def decorator(func: Callable) -> Callable:
         @wraps(func)
         def wrapper(self, *args, **kwargs):
-            is_disabled = getattr(self, "disable_perf_hints", False)
+            config = self.config
 
-            if not is_disabled and getattr(self, "force_C", False):
+            if not config.disable_perf_hints and config.force_C:
                 print("\033[1;33mJust a heads up!\033[0m "
                         "Program forces C, potentially slower than pure Python.")
 
-            elif not is_disabled and not getattr(self, "use_C", True):
+            elif not config.disable_perf_hints and not config.use_C:
                 if self.m * self.n > threshold:
                     print(f"\033[1;33mJust a heads up!\033[0m "
                             f"Large matrix op ({self.m}x{self.n}) is running in pure Python.")
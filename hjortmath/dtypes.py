@@ -0,0 +1,145 @@
+# src/dtypes.py
+"""
+Element types supported by Matrix storage and the C kernels.
+
+Every dtype maps onto an `array.array` typecode (the Matrix storage), a ctypes
+scalar (the kernel argument type) and a kernel suffix (`mat_add_f32`, ...).
+"""
+
+from .imports import *
+
+
+class DType:
+    """
+    DESCRIPTOR FOR THE ELEMENT TYPE OF A MATRIX.
+    """
+
+    __slots__ = ("name", "suffix", "typecode", "ctype", "is_float")
+
+    def __init__(self, name: str, suffix: str, typecode: str, ctype: Any, is_float: bool) -> None:
+        self.name = name
+        self.suffix = suffix
+        self.typecode = typecode
+        self.ctype = ctype
+        self.is_float = is_float
+
+    @property
+    def itemsize(self) -> int:
+        """SIZE OF ONE ELEMENT IN BYTES"""
+        return ctypes.sizeof(self.ctype)
+
+    @property
+    def limits(self) -> Tuple[Union[float, int], Union[float, int]]:
+        """SMALLEST AND LARGEST REPRESENTABLE VALUE (INFINITE FOR FLOAT DTYPES)"""
+        if self.is_float:
+            return -math.inf, math.inf
+        bits: int = 8 * self.itemsize
+        return -(1 << (bits - 1)), (1 << (bits - 1)) - 1
+
+    def cast(self, value: Any) -> Union[float, int]:
+        """CONVERT A PYTHON SCALAR TO THIS DTYPE (OverflowError IF IT DOES NOT FIT AN INTEGER DTYPE)"""
+        if self.is_float:
+            return float(value)
+        value = int(value)
+        lo, hi = self.limits
+        if not lo <= value <= hi:
+            raise OverflowError(f"{value} does not fit in {self}")
+        return value
+
+    def __reduce__(self) -> Tuple[Any, Tuple[str]]:
+        """UNPICKLE TO THE MODULE-LEVEL INSTANCE SO IDENTITY CHECKS KEEP WORKING"""
+        return resolve_dtype, (self.name,)
+
+    def __repr__(self) -> str:
+        return f"hjortmath.{self.name}"
+
+
+float32 = DType("float32", "f32", "f", ctypes.c_float, True)
+float64 = DType("float64", "f64", "d", ctypes.c_double, True)
+int32 = DType("int32", "i32", "i", ctypes.c_int32, False)
+int64 = DType("int64", "i64", "q", ctypes.c_int64, False)
+
+DTYPES: Tuple[DType, ...] = (float32, float64, int32, int64)
+
+_ALIASES = {
+    "float32": float32, "f32": float32, "single": float32, "f": float32,
+    "float64": float64, "f64": float64, "double": float64, "d": float64, "float": float64,
+    "int32": int32, "i32": int32, "i": int32,
+    "int64": int64, "i64": int64, "q": int64, "int": int64,
+    float: float64,
+    int: int64,
+}
+
+
+def resolve_dtype(dtype: Any = None) -> DType:
+    """Turn a dtype spec (DType, name, typecode or Python type) into a DType. None means float64."""
+    if dtype is None:
+        return float64
+    if isinstance(dtype, DType):
+        return dtype
+    try:
+        return _ALIASES[dtype]
+    except (KeyError, TypeError):
+        raise TypeError(f"Unsupported dtype: {dtype!r}") from None
+
+
+def dtype_of(values: Any) -> DType:
+    """Dtype of a storage array, float64 for anything else (lists, tuples)."""
+    if isinstance(values, array.array):
+        return _ALIASES[values.typecode]
+    return float64
+
+
+def promote_types(a: Any, b: Any) -> DType:
+    """
+    Result dtype of a binary operation between two matrices.
+
+    Equal dtypes are kept, two integer dtypes widen to int64 and any other
+    mix (including float32 with an integer) goes to float64.
+    """
+    a, b = resolve_dtype(a), resolve_dtype(b)
+    if a is b:
+        return a
+    if not a.is_float and not b.is_float:
+        return int64
+    return float64
+
+
+def scalar_result_type(dtype: Any, scalar: Union[float, int]) -> DType:
+    """
+    Result dtype of a matrix-scalar operation. Python ints keep the matrix
+    dtype unless they do not fit it, in which case they widen to int64 (or
+    float64 beyond the int64 range).
+    """
+    dtype = resolve_dtype(dtype)
+    if dtype.is_float:
+        return dtype
+    if isinstance(scalar, float):
+        return float64
+    for candidate in (dtype, int64):
+        lo, hi = candidate.limits
+        if lo <= scalar <= hi:
+            return candidate
+    return float64
+
+
+def as_storage(values: Any, dtype: Any = None, copy: bool = False, wrap: bool = False) -> "array.array":
+    """
+    Return `values` as an array.array of `dtype`, reusing it when it already
+    is one (unless copy=True). With wrap=True integers that overflow the dtype
+    wrap around (two's complement) like the C kernels instead of raising;
+    `values` must then be a sequence, not an iterator.
+    """
+    dtype = resolve_dtype(dtype)
+    if isinstance(values, array.array) and values.typecode == dtype.typecode:
+        return array.array(dtype.typecode, values) if copy else values
+    if dtype.is_float:
+        return array.array(dtype.typecode, values)
+    try:
+        return array.array(dtype.typecode, map(int, values))
+    except OverflowError:
+        if not wrap:
+            raise
+    lo, hi = dtype.limits
+    span: int = hi - lo + 1
+    return array.array(dtype.typecode, [(int(v) - lo) % span + lo for v in values])
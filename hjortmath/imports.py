@@ -1,7 +1,13 @@
 # src/imports.py
 import random
 import time
-from typing import Self, Any, Union, List, Tuple, Optional, TYPE_CHECKING
+from typing import Self, Any, Union, List, Tuple, Dict, Optional, Callable, Iterator, NamedTuple, TYPE_CHECKING
+from contextlib import contextmanager
+import operator
+import math
+import array
 import ctypes
 import os
-from functools import wraps
\ No newline at end of file
+import threading
+import warnings
+from functools import wraps
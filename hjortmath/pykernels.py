@@ -0,0 +1,480 @@
+# src/pykernels.py
+"""
+Pure Python versions of the libcmat kernels.
+
+cmat.py falls back to these when libcmat.so cannot be loaded, and Matrix
+uses them directly when use_C is off. Signatures and return types
+(array.array storage) match their cmat.py counterparts; floating point
+edge cases (division by zero, log of zero, overflow) give inf/nan like C
+instead of raising, and integer overflow wraps like C.
+"""
+
+from .imports import *
+from .dtypes import float64, int64, resolve_dtype, dtype_of, as_storage
+
+
+# Unary ufuncs: float-only ones promote integer input to float64, the rest keep the dtype
+FLOAT_UFUNCS: Tuple[str, ...] = ("exp", "log", "sqrt", "tanh", "sigmoid", "power")
+UFUNCS: Tuple[str, ...] = ("abs", "clip", "gt", "ge", "lt", "le", "eq", "ne")
+PARAM_UFUNCS: Tuple[str, ...] = ("power", "clip", "gt", "ge", "lt", "le", "eq", "ne")
+COMPARISONS: Tuple[str, ...] = ("gt", "ge", "lt", "le", "eq", "ne")
+
+# Result of a comparison against a threshold above (True) or below (False) every value of the dtype
+_OUT_OF_RANGE_MASKS: Dict[str, Tuple[int, int]] = {
+    "gt": (0, 1), "ge": (0, 1), "lt": (1, 0), "le": (1, 0), "eq": (0, 0), "ne": (1, 1),
+}
+
+
+def _dtype_for(values, dtype):
+    """Explicit dtype if given, otherwise the dtype of the storage"""
+    return resolve_dtype(dtype) if dtype is not None else dtype_of(values)
+
+
+def float_dtype(dtype):
+    """Dtype used by kernels that only exist for floating types"""
+    return dtype if dtype.is_float else float64
+
+
+def ufunc_dtype(name, dtype):
+    """Dtype a ufunc computes in for input of `dtype`"""
+    return float_dtype(dtype) if name in FLOAT_UFUNCS else dtype
+
+
+def fit_params(name, params, dtype):
+    """
+    Bring ufunc parameters into the range of an integer dtype before they are
+    cast: clip bounds are clamped to the dtype limits, and a comparison against
+    a threshold outside them has a constant result. Returns (params, fill)
+    where fill is that constant (0 or 1) or None.
+    """
+    if dtype.is_float or not params or (name != "clip" and name not in COMPARISONS):
+        return params, None
+
+    lo, hi = dtype.limits
+    if name == "clip":
+        return tuple(min(max(p, lo), hi) for p in params), None
+    threshold = params[0]
+    if lo <= threshold <= hi:
+        return params, None
+    return params, _OUT_OF_RANGE_MASKS[name][0 if threshold > hi else 1]
+
+
+def broadcast_shape(a_shape, b_shape):
+    """Result shape of broadcasting two (rows, cols) shapes, or None if they are incompatible"""
+    shape = []
+    for a, b in zip(a_shape, b_shape):
+        if a != b and a != 1 and b != 1:
+            return None
+        shape.append(max(a, b))
+    return tuple(shape)
+
+
+def broadcast_strides(shape, out_shape):
+    """Row and column stride of an operand read against a result shape; 0 repeats the operand"""
+    rows, cols = shape
+    m, n = out_shape
+    return (cols if rows == m else 0), (1 if cols == n else 0)
+
+
+# --- IEEE-STYLE SCALAR FUNCTIONS ---
+
+def _divide(a, b):
+    try:
+        return a / b
+    except ZeroDivisionError:
+        if a == 0 or a != a:
+            return math.nan
+        return math.copysign(math.inf, a) * math.copysign(1.0, b)
+
+def _exp(x):
+    try:
+        return math.exp(x)
+    except OverflowError:
+        return math.inf
+
+def _log(x):
+    if x > 0:
+        return math.log(x)
+    return -math.inf if x == 0 else math.nan
+
+def _sqrt(x):
+    return math.sqrt(x) if x >= 0 else math.nan
+
+def _sigmoid(x):
+    if x >= 0:
+        return 1.0 / (1.0 + math.exp(-x))
+    e = _exp(x)
+    return e / (1.0 + e)
+
+def _power(x, p):
+    if p == 2:
+        return x * x
+    if x == 0 and p < 0:
+        # C pow: a zero base keeps its sign only for odd integer exponents
+        odd = math.isfinite(p) and p == int(p) and int(p) % 2 == 1
+        return math.copysign(math.inf, x) if odd else math.inf
+    try:
+        return math.pow(x, p)
+    except ValueError:
+        return math.nan
+    except OverflowError:
+        return math.inf
+
+
+PY_UFUNCS: dict = {
+    "exp": _exp,
+    "log": _log,
+    "sqrt": _sqrt,
+    "tanh": math.tanh,
+    "sigmoid": _sigmoid,
+    "abs": abs,
+    "power": _power,
+    "clip": lambda x, low, high: min(max(x, low), high),
+    "gt": operator.gt,
+    "ge": operator.ge,
+    "lt": operator.lt,
+    "le": operator.le,
+    "eq": operator.eq,
+    "ne": operator.ne,
+}
+
+BINARY_OPS: dict = {
+    "mat_add": operator.add,
+    "mat_sub": operator.sub,
+    "hadamard": operator.mul,
+    "mat_div": _divide,
+}
+
+
+# --- KERNELS ---
+
+def _elementwise(name, A, B, dtype):
+    if len(B) != len(A):
+        raise ValueError("Arrays must have same length")
+
+    op = BINARY_OPS[name]
+    return as_storage([op(a, b) for a, b in zip(A, B)], _dtype_for(A, dtype), wrap=True)
+
+
+def mat_add(A, B, m=None, n=None, use_OMP=True, dtype=None):
+    return _elementwise("mat_add", A, B, dtype)
+
+
+def mat_sub(A, B, m=None, n=None, use_OMP=True, dtype=None):
+    return _elementwise("mat_sub", A, B, dtype)
+
+
+def hadamard(A, B, m=None, n=None, use_OMP=True, dtype=None):
+    return _elementwise("hadamard", A, B, dtype)
+
+
+def broadcast_op(name, A, a_shape, B, b_shape, use_OMP=True, dtype=None):
+    out_shape = broadcast_shape(a_shape, b_shape)
+    if out_shape is None:
+        raise ValueError(f"Shapes {a_shape} and {b_shape} cannot be broadcast together")
+
+    dtype = _dtype_for(A, dtype)
+    if name == "mat_div":
+        dtype = float_dtype(dtype)
+
+    m, n = out_shape
+    a_rs, a_cs = broadcast_strides(a_shape, out_shape)
+    b_rs, b_cs = broadcast_strides(b_shape, out_shape)
+    op = BINARY_OPS[name]
+
+    return as_storage(
+        [op(A[i * a_rs + j * a_cs], B[i * b_rs + j * b_cs]) for i in range(m) for j in range(n)],
+        dtype,
+        wrap=True,
+    )
+
+
+def unary_op(name, A, *params, use_OMP=True, dtype=None, out=None):
+    dtype = ufunc_dtype(name, _dtype_for(A, dtype))
+    func = PY_UFUNCS[name]
+    params, fill = fit_params(name, params, dtype)
+    if fill is not None:
+        result = as_storage([fill] * len(A), dtype)
+    else:
+        if name in PARAM_UFUNCS:
+            params = tuple(dtype.cast(p) for p in params)
+        result = as_storage([func(x, *params) for x in A], dtype, wrap=True)
+    if out is None:
+        return result
+    out[:] = result
+    return out
+
+
+def mat_minmax(A, use_OMP=True, dtype=None):
+    if len(A) == 0:
+        raise ValueError("Cannot reduce an empty array")
+    return min(A), max(A)
+
+
+def mat_mul(A, B, m, n, p, use_OMP=True, dtype=None):
+    dtype = _dtype_for(A, dtype)
+    columns = [B[j::p] for j in range(p)]
+    return as_storage(
+        [sum(map(operator.mul, A[i * n : (i + 1) * n], col)) for i in range(m) for col in columns],
+        dtype,
+        wrap=True,
+    )
+
+
+def scalar_mul(A, scalar, m=None, n=None, use_OMP=True, dtype=None):
+    dtype = _dtype_for(A, dtype)
+    scalar = dtype.cast(scalar)
+    return as_storage([x * scalar for x in A], dtype, wrap=True)
+
+
+def mat_det(A, n, use_OMP=True, dtype=None):
+    if len(A) != n * n:
+        raise ValueError("Matrix list size does not match provided dimensions.")
+
+    rows = [[float(v) for v in A[i * n : (i + 1) * n]] for i in range(n)]
+    det = 1.0
+    for i in range(n):
+        pivot = max(range(i, n), key=lambda r: abs(rows[r][i]))
+        if pivot != i:
+            rows[i], rows[pivot] = rows[pivot], rows[i]
+            det = -det
+        if abs(rows[i][i]) < 1e-12:
+            return 0.0
+        det *= rows[i][i]
+        for j in range(i + 1, n):
+            factor = rows[j][i] / rows[i][i]
+            rows[j][i:] = [a - factor * b for a, b in zip(rows[j][i:], rows[i][i:])]
+    return det
+
+
+def mat_inv(A, n, use_OMP=True, dtype=None):
+    if len(A) != n * n:
+        raise ValueError("Matrix list size does not match provided dimensions.")
+
+    dtype = float_dtype(_dtype_for(A, dtype))
+    rows = [[float(v) for v in A[i * n : (i + 1) * n]] + [1.0 if j == i else 0.0 for j in range(n)] for i in range(n)]
+    for i in range(n):
+        pivot = max(range(i, n), key=lambda r: abs(rows[r][i]))
+        rows[i], rows[pivot] = rows[pivot], rows[i]
+        diag = rows[i][i]
+        if diag == 0:
+            raise ValueError("Matrix is singular and cannot be inverted.")
+        rows[i] = [v / diag for v in rows[i]]
+        for j in range(n):
+            if j != i and rows[j][i] != 0:
+                factor = rows[j][i]
+                rows[j] = [a - factor * b for a, b in zip(rows[j], rows[i])]
+    return as_storage([v for row in rows for v in row[n:]], dtype)
+
+
+def mat_pow(A, n, k, use_OMP=True, dtype=None):
+    if len(A) != n * n:
+        raise ValueError("Matrix list size does not match provided dimensions.")
+    if k < 0:
+        raise ValueError(f"Power must be non-negative (got {k}); invert the matrix first")
+
+    dtype = _dtype_for(A, dtype)
+    result = None
+    square = as_storage(A, dtype)
+    while k:
+        if k & 1:
+            result = square if result is None else mat_mul(result, square, n, n, n, dtype=dtype)
+        k >>= 1
+        if k:
+            square = mat_mul(square, square, n, n, n, dtype=dtype)
+
+    if result is None:
+        return as_storage([1 if i == j else 0 for i in range(n) for j in range(n)], dtype)
+    return as_storage(result, dtype, copy=result is A)
+
+
+# Padé degrees and the 1-norm below which each is accurate to double precision (Higham 2005)
+_EXPM_DEGREES: Tuple[int, ...] = (3, 5, 7, 9, 13)
+_EXPM_THETAS: Tuple[float, ...] = (
+    1.495585217958292e-2, 2.539398330063230e-1, 9.504178996162932e-1,
+    2.097847961257068e0, 5.371920351148152e0,
+)
+
+
+def _pade_coefficients(m):
+    b = [1.0]
+    for j in range(1, m + 1):
+        b.append(b[-1] * (m - j + 1) / (j * (2 * m - j + 1)))
+    return b
+
+
+def _lincomb(mats, coefs, diag, n, out=None):
+    """out (or zero) + sum coef * mat + diag * I, on flat float lists"""
+    values = list(out) if out is not None else [0.0] * (n * n)
+    for coef, mat in zip(coefs, mats):
+        values = [v + coef * x for v, x in zip(values, mat)]
+    for i in range(n):
+        values[i * n + i] += diag
+    return values
+
+
+def _solve(M, B, n):
+    """Solve M X = B for square n x n M and B (flat lists) by Gaussian elimination with partial pivoting"""
+    M = [M[i * n : (i + 1) * n] for i in range(n)]
+    B = [B[i * n : (i + 1) * n] for i in range(n)]
+    for k in range(n):
+        pivot = max(range(k, n), key=lambda r: abs(M[r][k]))
+        if M[pivot][k] == 0:
+            return None
+        M[k], M[pivot] = M[pivot], M[k]
+        B[k], B[pivot] = B[pivot], B[k]
+        diag = M[k][k]
+        for i in range(k + 1, n):
+            f = M[i][k] / diag
+            if f:
+                M[i] = [a - f * b for a, b in zip(M[i], M[k])]
+                B[i] = [a - f * b for a, b in zip(B[i], B[k])]
+    for k in reversed(range(n)):
+        row = B[k]
+        for j in range(k + 1, n):
+            f = M[k][j]
+            row = [a - f * b for a, b in zip(row, B[j])]
+        B[k] = [v / M[k][k] for v in row]
+    return [v for row in B for v in row]
+
+
+def mat_expm(A, n, use_OMP=True, dtype=None):
+    if len(A) != n * n:
+        raise ValueError("Matrix list size does not match provided dimensions.")
+
+    dtype = float_dtype(_dtype_for(A, dtype))
+    A = [float(v) for v in A]
+    norm = max(sum(abs(A[i * n + j]) for i in range(n)) for j in range(n))
+    if not math.isfinite(norm):
+        return as_storage([math.nan] * (n * n), dtype)
+
+    idx = next((i for i, theta in enumerate(_EXPM_THETAS[:4]) if norm <= theta), 4)
+    s = max(0, math.ceil(math.log2(norm / _EXPM_THETAS[4]))) if idx == 4 else 0
+    m = _EXPM_DEGREES[idx]
+    b = _pade_coefficients(m)
+
+    def mul(X, Y):
+        return list(mat_mul(X, Y, n, n, n, dtype=float64))
+
+    X = [math.ldexp(v, -s) for v in A]
+    powers = [mul(X, X)]
+    for _ in range(1, 3 if m == 13 else (m - 1) // 2):
+        powers.append(mul(powers[-1], powers[0]))
+
+    if m == 13:
+        hi = powers[::-1]
+        U = mul(X, _lincomb(hi, (b[7], b[5], b[3]), b[1], n, out=mul(powers[2], _lincomb(hi, (b[13], b[11], b[9]), 0.0, n))))
+        V = _lincomb(hi, (b[6], b[4], b[2]), b[0], n, out=mul(powers[2], _lincomb(hi, (b[12], b[10], b[8]), 0.0, n)))
+    else:
+        U = mul(X, _lincomb(powers, b[3::2], b[1], n))
+        V = _lincomb(powers, b[2::2], b[0], n)
+
+    E = _solve([v - u for u, v in zip(U, V)], [v + u for u, v in zip(U, V)], n)
+    if E is None:
+        return as_storage([math.nan] * (n * n), dtype)
+    for _ in range(s):
+        E = mul(E, E)
+    return as_storage(E, dtype)
+
+
+# --- RANDOM NUMBERS (same Philox4x32-10 streams as cmat.c) ---
+#
+# These reproduce the native streams bit for bit, so a seed gives the same
+# matrix with or without libcmat. The price is speed: ten 32-bit multiply
+# rounds per entry cost roughly 7 us in pure Python (about 1 s for 400x400,
+# 100 s for 4000x4000), against ~0.2 us per entry for random.uniform.
+# Matrix prints a performance hint before large draws on this path.
+
+_MASK32: int = 0xFFFFFFFF
+
+
+def philox4x32_10(counter, seed):
+    """Philox4x32-10 block for a 4-word counter under a 64-bit seed"""
+    c0, c1, c2, c3 = counter
+    k0, k1 = seed & _MASK32, (seed >> 32) & _MASK32
+    for r in range(10):
+        if r:
+            k0 = (k0 + 0x9E3779B9) & _MASK32
+            k1 = (k1 + 0xBB67AE85) & _MASK32
+        p0 = 0xD2511F53 * c0
+        p1 = 0xCD9E8D57 * c2
+        c0, c1, c2, c3 = (p1 >> 32) ^ c1 ^ k0, p1 & _MASK32, (p0 >> 32) ^ c3 ^ k1, p0 & _MASK32
+    return c0, c1, c2, c3
+
+
+def _philox_unit(hi, lo):
+    return ((hi >> 5) * 67108864.0 + (lo >> 6)) * (1.0 / 9007199254740992.0)
+
+
+def _philox_blocks(size, seed):
+    """philox4x32_10 of counters 0..size-1, with the key schedule computed once"""
+    k0, k1 = seed & _MASK32, (seed >> 32) & _MASK32
+    keys = [((k0 + r * 0x9E3779B9) & _MASK32, (k1 + r * 0xBB67AE85) & _MASK32) for r in range(10)]
+    for i in range(size):
+        c0, c1, c2, c3 = i & _MASK32, i >> 32, 0, 0
+        for k0, k1 in keys:
+            p0 = 0xD2511F53 * c0
+            p1 = 0xCD9E8D57 * c2
+            c0, c1, c2, c3 = (p1 >> 32) ^ c1 ^ k0, p1 & _MASK32, (p0 >> 32) ^ c3 ^ k1, p0 & _MASK32
+        yield c0, c1, c2, c3
+
+
+def _round_to(value, dtype):
+    return array.array(dtype.typecode, [value])[0]
+
+
+def _next_below(value, dtype):
+    """Largest value of a float dtype strictly below `value` (itself a value of that dtype)"""
+    if dtype.itemsize == 8:
+        return math.nextafter(value, -math.inf)
+    bits = array.array("i", array.array("f", [value]).tobytes())[0]
+    if value == 0:
+        bits = -0x7FFFFFFF    # sign bit | 1: the smallest negative subnormal
+    else:
+        bits += -1 if value > 0 else 1
+    return array.array("f", array.array("i", [bits]).tobytes())[0]
+
+
+def random_uniform(size, seed, low=0.0, high=1.0, use_OMP=True, dtype=None):
+    dtype = resolve_dtype(dtype)
+    span = high - low
+    values = as_storage([low + span * _philox_unit(c[0], c[1]) for c in _philox_blocks(size, seed)], dtype)
+
+    # Rounding to the dtype can land on high; clamp to the largest value below it like cmat.c
+    top = _round_to(high, dtype)
+    if top >= high:
+        top = _next_below(top, dtype)
+    top = max(top, _round_to(low, dtype))
+    for i, v in enumerate(values):
+        if v > top:
+            values[i] = top
+    return values
+
+
+def random_normal(size, seed, mean=0.0, std=1.0, use_OMP=True, dtype=None):
+    dtype = resolve_dtype(dtype)
+    values = []
+    for c in _philox_blocks(size, seed):
+        r = math.sqrt(-2.0 * math.log(1.0 - _philox_unit(c[0], c[1])))
+        values.append(mean + std * (r * math.cos(6.283185307179586 * _philox_unit(c[2], c[3]))))
+    return as_storage(values, dtype)
+
+
+def check_integer_bounds(low, high, dtype):
+    """Raise ValueError unless [low, high) is a non-empty range representable in `dtype`"""
+    if low >= high:
+        raise ValueError(f"Low bound {low} must be smaller than high bound {high}")
+    lo, hi = dtype.limits
+    if low < lo or high - 1 > hi:
+        raise ValueError(f"Bounds [{low}, {high}) do not fit in {dtype} (values {lo} to {hi})")
+
+
+def random_integers(size, seed, low, high, use_OMP=True, dtype=None):
+    dtype = resolve_dtype(dtype if dtype is not None else int64)
+    check_integer_bounds(low, high, dtype)
+    span = high - 1 - low
+    values = []
+    for c in _philox_blocks(size, seed):
+        x = (c[0] << 32) | c[1]
+        values.append(low + (x if span == 2**64 - 1 else (x * (span + 1)) >> 64))
+    return as_storage(values, dtype)
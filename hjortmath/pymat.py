@@ -1,6 +1,21 @@
 from .imports import *
-from . import cmat
+from . import cmat, pykernels
 from .customdecorators import alias, validate_dimensions, performance_warning
+from .dtypes import DType, float64, int64, resolve_dtype, promote_types, scalar_result_type, as_storage
+from .config import MatrixConfig, config_from_kwargs
+
+
+def _config_property(field: str) -> property:
+    """EXPOSE A CONFIG FIELD AS A MATRIX ATTRIBUTE; ASSIGNING IT SWAPS IN THE MATCHING SHARED CONFIG"""
+    def getter(self: "Matrix") -> Any:
+        return getattr(self.config, field)
+
+    def setter(self: "Matrix", value: Any) -> None:
+        self.config = self.config.replace(**{field: value})
+        self._cached_repr = None
+
+    return property(getter, setter, doc=f"{field.upper()} OPTION OF THE SHARED CONFIG")
+
 
 class Matrix:
     """
@@ -8,41 +23,42 @@ class Matrix:
 
     WRITTEN FOR FUN, NOT FOR SPEED!
     """
+
+    __slots__ = ("entries", "m", "n", "dtype", "config", "_cached_repr")
     
+    repr_threshold: int = 1000
+    repr_edgeitems: int = 3
+
     # --- INITIALIZATION ---
 
     def __init__(self, *rows: Any, **kwargs: Any) -> None:
         """CONSTRUCTOR FOR MATRIX"""
-        self.entries: List[float] = []
+        self.dtype: DType = resolve_dtype(kwargs.get('dtype'))
+        self.entries: array.array = array.array(self.dtype.typecode)
         self.m: int = 0
         self.n: int = 0
 
-        self.use_C: bool = kwargs.get('use_C', True)
-        self.force_C: bool = kwargs.get('force_C', False)
-        self.use_color: bool = kwargs.get('use_color', True)
-        self.sig_digits: int = kwargs.get('sig_digits', 4)
-        self.disable_perf_hints: bool = kwargs.get('disable_warnings', False)
-        self.multithreaded: bool = kwargs.get('multithreaded', True)
+        self.config: MatrixConfig = config_from_kwargs(kwargs)
         
-        self._cached_repr: Optional[str] = None
+        self._cached_repr: Optional[Tuple[Tuple[int, int], str]] = None
 
-        def parse_single_row(rows_data: Tuple[Any, ...]) -> Optional[Tuple[List[float], int, int]]:
+        def parse_single_row(rows_data: Tuple[Any, ...]) -> Optional[Tuple[array.array, int, int]]:
             """PARSE A SINGLE DIMENSION INPUT"""
             if all(isinstance(i, (int, float)) for i in rows_data):
-                return [float(i) for i in rows_data], 1, len(rows_data)
+                return as_storage(rows_data, self.dtype), 1, len(rows_data)
             return None
 
-        def parse_multi_row(rows_data: Tuple[Any, ...]) -> Optional[Tuple[List[float], int, int]]:
+        def parse_multi_row(rows_data: Tuple[Any, ...]) -> Optional[Tuple[array.array, int, int]]:
             """PARSE MULTIPLE ROW INPUT"""
             if all(isinstance(row, tuple) and len(row) == len(rows_data[0]) for row in rows_data):
-                entries: List[float] = [float(i) for row in rows_data for i in row]
+                entries: array.array = as_storage([i for row in rows_data for i in row], self.dtype)
                 return entries, len(rows_data), len(rows_data[0])
             return None
 
         if not rows:
             raise ValueError("Matrix cannot be empty.")
 
-        result: Optional[Tuple[List[float], int, int]] = parse_single_row(rows) or parse_multi_row(rows)
+        result: Optional[Tuple[array.array, int, int]] = parse_single_row(rows) or parse_multi_row(rows)
         if result is None:
             raise TypeError("Each row must be a tuple of equal length.")
         
@@ -54,19 +70,55 @@ class Matrix:
         """CONVERT INTERNAL FLAT LIST TO LIST OF TUPLES"""
         return Matrix.to_tuple_form(self.entries, self.n, self.m)
 
-    def _smul(self, other: float) -> Self:
+    def _smul(self, other: Union[float, int]) -> Self:
         """PERFORM SCALAR MULTIPLICATION"""
-        return Matrix._from_flat([other * i for i in self.entries], self.n, self.m, template=self)
+        config: MatrixConfig = self.config
+        dtype: DType = scalar_result_type(self.dtype, other)
+        if config.use_C:
+            C_entries: array.array = cmat.scalar_mul(self.entries, other, use_OMP=config.multithreaded, dtype=dtype)
+            return Matrix._from_flat(C_entries, self.n, self.m, template=self, dtype=dtype)
+        return Matrix._from_flat(as_storage([other * i for i in self.entries], dtype, wrap=True), self.n, self.m, template=self, dtype=dtype)
+
+    def _broadcast(self, other: Union[Self, float, int], kernel: str, reflected: bool = False) -> Self:
+        """APPLY AN ELEMENTWISE OPERATION, BROADCASTING SCALARS, ROW VECTORS AND COLUMN VECTORS"""
+        config: MatrixConfig = self.config
+        dtype: DType
+        if isinstance(other, (float, int)):
+            dtype = scalar_result_type(self.dtype, other)
+            other_entries, other_shape = [other], (1, 1)
+        else:
+            dtype = promote_types(self.dtype, other.dtype)
+            other_entries, other_shape = other.entries, (other.m, other.n)
+
+        if kernel == "mat_div" and not dtype.is_float:
+            dtype = float64
+
+        A, a_shape, B, b_shape = self.entries, (self.m, self.n), other_entries, other_shape
+        if reflected:
+            A, a_shape, B, b_shape = B, b_shape, A, a_shape
+        m, n = cmat.broadcast_shape(a_shape, b_shape)
+
+        # Same-shape add/sub/mul stay in Python; division always runs in C when use_C is set
+        if a_shape == b_shape and not config.force_C and not (kernel == "mat_div" and config.use_C):
+            op: Callable[[Any, Any], Any] = pykernels.BINARY_OPS[kernel]
+            entries: Any = as_storage([op(i, j) for i, j in zip(A, B)], dtype, wrap=True)
+        elif config.use_C or config.force_C:
+            entries = cmat.broadcast_op(kernel, A, a_shape, B, b_shape, use_OMP=config.multithreaded, dtype=dtype)
+        else:
+            entries = pykernels.broadcast_op(kernel, A, a_shape, B, b_shape, dtype=dtype)
+
+        return Matrix._from_flat(entries, n, m, template=self, dtype=dtype)
 
     def _determinant(self, _internal: bool = False) -> float:
         """INTERNAL DETERMINANT CALCULATION LOGIC"""
+        config: MatrixConfig = self.config
         if self.n == 1:
             return self.entries[0]
         elif self.n == 2:
             return self.entries[0] * self.entries[3] - self.entries[1] * self.entries[2]
 
-        if self.use_C:
-            return float(cmat.mat_det(self.entries, self.n, use_OMP=self.multithreaded))
+        if config.use_C:
+            return float(cmat.mat_det(self.entries, self.n, use_OMP=config.multithreaded, dtype=self.dtype))
 
         if not _internal:
             yellow_bold: str = "\033[1;33m"
@@ -93,6 +145,52 @@ class Matrix:
 
         return laplace_expansion(self.entries, self.n)
 
+    def _ufunc(self, name: str, *params: Union[float, int], inplace: bool = False) -> Self:
+        """APPLY A UFUNC ELEMENTWISE, IN C UNLESS use_C IS OFF"""
+        config: MatrixConfig = self.config
+        dtype: DType = self.dtype
+        for param in params:
+            # Float parameters promote integer matrices; integer ones never widen a mask or clip result
+            if isinstance(param, float):
+                dtype = scalar_result_type(dtype, param)
+        dtype = cmat.ufunc_dtype(name, dtype)
+        if inplace and dtype is not self.dtype:
+            raise TypeError(f"In-place {name} would change the dtype from {self.dtype} to {dtype}; use astype first")
+
+        entries: array.array
+        if config.use_C:
+            entries = cmat.unary_op(name, self.entries, *params, use_OMP=config.multithreaded, dtype=dtype,
+                                    out=self.entries if inplace else None)
+        else:
+            entries = pykernels.unary_op(name, self.entries, *params, dtype=dtype,
+                                         out=self.entries if inplace else None)
+
+        if inplace:
+            self._cached_repr = None
+            return self
+        return Matrix._from_flat(entries, self.n, self.m, template=self, dtype=dtype)
+
+    def _format_entry(self, val: Union[float, int]) -> str:
+        """FORMAT A SINGLE ENTRY USING sig_digits"""
+        sig_digits: int = self.config.sig_digits
+        if self.dtype.is_float and sig_digits >= 0:
+            return f"{val:.{sig_digits}g}"
+        return f"{val}"
+
+    def _minmax(self) -> Tuple[Union[float, int], Union[float, int]]:
+        """SMALLEST AND LARGEST ENTRY, FROM A SINGLE NATIVE PASS WHEN use_C IS SET"""
+        config: MatrixConfig = self.config
+        if config.use_C:
+            return cmat.mat_minmax(self.entries, use_OMP=config.multithreaded)
+        return min(self.entries), max(self.entries)
+
+    @staticmethod
+    def _edge_indices(size: int, edgeitems: int, summarize: bool) -> List[Optional[int]]:
+        """INDICES KEPT BY A SUMMARIZED REPR, WITH None MARKING THE ELLIPSIS"""
+        if not summarize or size <= 2 * edgeitems:
+            return list(range(size))
+        return list(range(edgeitems)) + [None] + list(range(size - edgeitems, size))
+
     # --- STATIC & CLASS METHODS ---
 
     @staticmethod
@@ -101,23 +199,34 @@ class Matrix:
         return [tuple(lst[i * n : (i + 1) * n]) for i in range(m)]
 
     @classmethod
-    def _from_flat(cls, entries: List[float], n: int, m: int, template: Self = None) -> Self:
-        """CREATE MATRIX INSTANCE FROM FLATTENED LIST"""
-        tuples: List[Tuple[float, ...]] = cls.to_tuple_form(entries, n, m)
-        if template is None:
-            return cls(*tuples)
-        return cls(
-            *tuples,
-            use_C=template.use_C,
-            force_C=template.force_C,
-            use_color=template.use_color,
-            sig_digits=template.sig_digits,
-            disable_warnings=template.disable_perf_hints,
-        )
+    def _from_flat(cls, entries: List[float], n: int, m: int, template: Self = None, dtype: Any = None) -> Self:
+        """CREATE MATRIX INSTANCE FROM FLATTENED LIST, SHARING THE TEMPLATE'S CONFIG"""
+        if dtype is None:
+            dtype = template.dtype if template is not None else float64
+        result: Self = cls.__new__(cls)
+        result.dtype = resolve_dtype(dtype)
+        result.entries = as_storage(entries, result.dtype)
+        result.m = m
+        result.n = n
+        result.config = template.config if template is not None else config_from_kwargs({})
+        result._cached_repr = None
+        return result
+
+    @classmethod
+    def set_printoptions(cls, threshold: Optional[int] = None, edgeitems: Optional[int] = None) -> None:
+        """SET THE ENTRY COUNT ABOVE WHICH REPR SUMMARIZES, AND HOW MANY EDGE ROWS/COLUMNS IT KEEPS"""
+        if threshold is not None:
+            if threshold < 0:
+                raise ValueError(f"Print threshold must be non-negative (got {threshold})")
+            cls.repr_threshold = threshold
+        if edgeitems is not None:
+            if edgeitems <= 0:
+                raise ValueError(f"Edge items must be positive (got {edgeitems})")
+            cls.repr_edgeitems = edgeitems
 
     @alias("ident", "IDENT", "I")
     @classmethod
-    def identity(cls, n: int) -> Self:
+    def identity(cls, n: int, dtype: Any = None) -> Self:
         """CREATE AN IDENTITY MATRIX OF SIZE N"""
         if n <= 0:
             raise ValueError(f"Provided matrix dimension (n={n}) must be greater than 0")
@@ -127,30 +236,193 @@ class Matrix:
             for i in range(n)
             for j in range(n)
         ]
-        return cls(*cls.to_tuple_form(entries, n, n))
+        return cls(*cls.to_tuple_form(entries, n, n), dtype=dtype)
     
     @alias("zero", "ZERO")
     @classmethod
-    def zero_matrix(cls, n: int) -> Self:
+    def zero_matrix(cls, n: int, dtype: Any = None) -> Self:
         """CREATE A ZERO MATRIX OF SIZE N"""
         if n <= 0:
             raise ValueError(f"Provided matrix dimension (n={n}) must be greater than 0")
-        return cls(*cls.to_tuple_form([0.0] * (n * n), n, n))
+        return cls(*cls.to_tuple_form([0.0] * (n * n), n, n), dtype=dtype)
 
-    @alias("rand", "RAND", "R")
     @classmethod
-    def random(cls, n: int, m: int, low: float = 0.0, high: float = 1.0) -> Self:
-        """CREATE A RANDOM MATRIX OF SIZE NXm"""
+    def _random(cls, kernel: str, n: int, m: int, a: Union[float, int], b: Union[float, int], dtype: DType, seed: Optional[int]) -> Self:
+        """FILL AN NXm MATRIX FROM THE COUNTER-BASED GENERATOR (ENTRY i DEPENDS ONLY ON seed AND i)"""
         if n <= 0 or m <= 0:
             raise ValueError(f"Matrix dimensions must be positive (got {n}x{m})")
+
+        config: MatrixConfig = config_from_kwargs({})
+        seed = (random.getrandbits(64) if seed is None else seed) % 2**64
+        backend: Any = cmat if config.use_C else pykernels
+
+        if n * m > 50_000 and not config.disable_perf_hints and not (config.use_C and cmat.native_available()):
+            print(f"\033[1;33mJust a heads up!\033[0m "
+                  f"Generating a {n}x{m} random matrix in pure Python (about 7 us per entry, to match the native streams). "
+                  f"Build libcmat.so with make and keep use_C=True for native speed, or set disable_perf_hints=True to turn off this warning.")
+        entries: array.array = getattr(backend, kernel)(n * m, seed, a, b, use_OMP=config.multithreaded, dtype=dtype)
+        return cls._from_flat(entries, n, m, dtype=dtype)
+
+    @alias("rand", "RAND", "R")
+    @classmethod
+    def random(cls, n: int, m: int, low: float = 0.0, high: float = 1.0, dtype: Any = None, seed: Optional[int] = None) -> Self:
+        """CREATE A UNIFORM RANDOM MATRIX OF SIZE NXm IN [low, high); THE SAME seed GIVES THE SAME MATRIX ON ANY THREAD COUNT"""
+        dtype = resolve_dtype(dtype)
+        if not dtype.is_float:
+            raise TypeError(f"Uniform random matrices need a float dtype (got {dtype}); use randint for integers")
         if low > high:
             raise ValueError(f"Low bound {low} cannot be greater than high bound {high}")
-        
-        entries: List[float] = [random.uniform(low, high) for _ in range(n * m)]
-        return cls(*cls.to_tuple_form(entries, n, m))
+        return cls._random("random_uniform", n, m, float(low), float(high), dtype, seed)
+
+    @alias("randn", "RANDN")
+    @classmethod
+    def random_normal(cls, n: int, m: int, mean: float = 0.0, std: float = 1.0, dtype: Any = None, seed: Optional[int] = None) -> Self:
+        """CREATE A NORMALLY DISTRIBUTED RANDOM MATRIX OF SIZE NXm"""
+        dtype = resolve_dtype(dtype)
+        if not dtype.is_float:
+            raise TypeError(f"Normal random matrices need a float dtype (got {dtype})")
+        if std < 0:
+            raise ValueError(f"Standard deviation must be non-negative (got {std})")
+        return cls._random("random_normal", n, m, float(mean), float(std), dtype, seed)
+
+    @alias("randint", "RANDINT")
+    @classmethod
+    def random_integers(cls, n: int, m: int, low: int, high: int, dtype: Any = int64, seed: Optional[int] = None) -> Self:
+        """CREATE A RANDOM INTEGER MATRIX OF SIZE NXm WITH ENTRIES IN [low, high)"""
+        dtype = resolve_dtype(dtype)
+        if dtype.is_float:
+            raise TypeError(f"Random integer matrices need an integer dtype (got {dtype})")
+        pykernels.check_integer_bounds(low, high, dtype)
+        return cls._random("random_integers", n, m, int(low), int(high), dtype, seed)
+
+    # --- CONVERSION ---
+
+    def astype(self, dtype: Any, copy: bool = True) -> Self:
+        """RETURN THE MATRIX CONVERTED TO ANOTHER DTYPE (FLOATS ARE TRUNCATED WHEN CAST TO INTEGERS)"""
+        dtype = resolve_dtype(dtype)
+        if dtype is self.dtype and not copy:
+            return self
+        return Matrix._from_flat(as_storage(self.entries, dtype, copy=copy), self.n, self.m, template=self, dtype=dtype)
+
+    def tolist(self) -> List[List[Union[float, int]]]:
+        """RETURN THE ENTRIES AS A NESTED LIST OF PYTHON SCALARS"""
+        return [self.entries[i * self.n : (i + 1) * self.n].tolist() for i in range(self.m)]
+
+    def write_to(self, file: Any, sep: str = "  ", precision: Optional[int] = None) -> None:
+        """STREAM EVERY ENTRY ROW BY ROW TO A PATH OR WRITABLE FILE OBJECT (NO COLOR, NO SUMMARY, FULL PRECISION UNLESS precision IS GIVEN)"""
+        if isinstance(file, (str, os.PathLike)):
+            with open(file, "w") as handle:
+                self.write_to(handle, sep=sep, precision=precision)
+            return
+
+        fmt: Callable[[Union[float, int]], str] = repr
+        if precision is not None and self.dtype.is_float:
+            fmt = lambda val: f"{val:.{precision}g}"
+
+        for i in range(self.m):
+            file.write(sep.join(fmt(val) for val in self.entries[i * self.n : (i + 1) * self.n]))
+            file.write("\n")
+
+    # --- REDUCTIONS ---
+
+    def min(self) -> Union[float, int]:
+        """SMALLEST ENTRY"""
+        return self._minmax()[0]
+
+    def max(self) -> Union[float, int]:
+        """LARGEST ENTRY"""
+        return self._minmax()[1]
+
+    # --- ELEMENTWISE FUNCTIONS ---
+
+    def exp(self, inplace: bool = False) -> Self:
+        """ELEMENTWISE EXPONENTIAL"""
+        return self._ufunc("exp", inplace=inplace)
+
+    def log(self, inplace: bool = False) -> Self:
+        """ELEMENTWISE NATURAL LOGARITHM"""
+        return self._ufunc("log", inplace=inplace)
+
+    def sqrt(self, inplace: bool = False) -> Self:
+        """ELEMENTWISE SQUARE ROOT"""
+        return self._ufunc("sqrt", inplace=inplace)
+
+    def tanh(self, inplace: bool = False) -> Self:
+        """ELEMENTWISE HYPERBOLIC TANGENT"""
+        return self._ufunc("tanh", inplace=inplace)
+
+    def sigmoid(self, inplace: bool = False) -> Self:
+        """ELEMENTWISE LOGISTIC SIGMOID 1 / (1 + EXP(-X))"""
+        return self._ufunc("sigmoid", inplace=inplace)
+
+    def abs(self, inplace: bool = False) -> Self:
+        """ELEMENTWISE ABSOLUTE VALUE"""
+        return self._ufunc("abs", inplace=inplace)
+
+    def power(self, exponent: Union[float, int], inplace: bool = False) -> Self:
+        """RAISE EACH ENTRY TO A SCALAR EXPONENT"""
+        return self._ufunc("power", exponent, inplace=inplace)
+
+    def clip(self, low: Union[float, int], high: Union[float, int], inplace: bool = False) -> Self:
+        """LIMIT EACH ENTRY TO THE RANGE [LOW, HIGH]"""
+        if low > high:
+            raise ValueError(f"Low bound {low} cannot be greater than high bound {high}")
+        return self._ufunc("clip", low, high, inplace=inplace)
+
+    def gt(self, value: Union[float, int]) -> Self:
+        """MASK (1/0) OF ENTRIES GREATER THAN VALUE"""
+        return self._ufunc("gt", value)
+
+    def ge(self, value: Union[float, int]) -> Self:
+        """MASK (1/0) OF ENTRIES GREATER THAN OR EQUAL TO VALUE"""
+        return self._ufunc("ge", value)
+
+    def lt(self, value: Union[float, int]) -> Self:
+        """MASK (1/0) OF ENTRIES LESS THAN VALUE"""
+        return self._ufunc("lt", value)
+
+    def le(self, value: Union[float, int]) -> Self:
+        """MASK (1/0) OF ENTRIES LESS THAN OR EQUAL TO VALUE"""
+        return self._ufunc("le", value)
+
+    def eq(self, value: Union[float, int]) -> Self:
+        """MASK (1/0) OF ENTRIES EQUAL TO VALUE"""
+        return self._ufunc("eq", value)
+
+    def ne(self, value: Union[float, int]) -> Self:
+        """MASK (1/0) OF ENTRIES NOT EQUAL TO VALUE"""
+        return self._ufunc("ne", value)
+
+    # --- MATRIX FUNCTIONS ---
+
+    @validate_dimensions("square")
+    def expm(self) -> Self:
+        """MATRIX EXPONENTIAL BY SCALING AND SQUARING WITH A PADE APPROXIMANT (INTEGERS PROMOTE TO FLOAT64)"""
+        config: MatrixConfig = self.config
+        dtype: DType = cmat.ufunc_dtype("exp", self.dtype)
+        backend: Any = cmat if config.use_C else pykernels
+        entries: array.array = backend.mat_expm(self.entries, self.n, use_OMP=config.multithreaded, dtype=dtype)
+        return Matrix._from_flat(entries, self.n, self.n, template=self, dtype=dtype)
 
     # --- PROPERTIES ---
 
+    use_C = _config_property("use_C")
+    force_C = _config_property("force_C")
+    use_color = _config_property("use_color")
+    sig_digits = _config_property("sig_digits")
+    disable_perf_hints = _config_property("disable_perf_hints")
+    multithreaded = _config_property("multithreaded")
+
+    @property
+    def itemsize(self) -> int:
+        """SIZE OF ONE ENTRY IN BYTES"""
+        return self.dtype.itemsize
+
+    @property
+    def nbytes(self) -> int:
+        """SIZE OF THE ENTRY STORAGE IN BYTES"""
+        return self.m * self.n * self.dtype.itemsize
+
     @alias("T")
     @property
     def transpose(self) -> Self:
@@ -173,12 +445,16 @@ class Matrix:
     @validate_dimensions("square")
     def inverse(self) -> Self:
         """CALCULATE THE INVERSE MATRIX"""
-        det: float = self._determinant(_internal=True)
+        config: MatrixConfig = self.config
+        # The pure Python determinant is a Laplace expansion; use the LU kernel for the singularity check instead
+        det: float = self._determinant(_internal=True) if config.use_C or self.n <= 2 else pykernels.mat_det(self.entries, self.n)
         if abs(det) < 1e-12:
             raise ValueError("Matrix is singular and cannot be inverted.")
 
+        inv_dtype: DType = self.dtype if self.dtype.is_float else resolve_dtype(float)
+
         if self.n == 1:
-            return Matrix((1.0 / self.entries[0],))
+            return Matrix._from_flat([1.0 / self.entries[0]], 1, 1, template=self, dtype=inv_dtype)
         elif self.n == 2:
             inv_entries: List[float] = [
                 self.entries[3] / det,
@@ -186,32 +462,33 @@ class Matrix:
                 -self.entries[2] / det,
                 self.entries[0] / det
             ]
-            return Matrix._from_flat(inv_entries, 2, 2, template=self)
+            return Matrix._from_flat(inv_entries, 2, 2, template=self, dtype=inv_dtype)
 
-        if self.use_C:
-            c_inv: List[float] = cmat.mat_inv(self.entries, self.n, use_OMP=self.multithreaded)
-            return Matrix._from_flat(c_inv, self.n, self.n, template=self)
+        if config.use_C:
+            c_inv: array.array = cmat.mat_inv(self.entries, self.n, use_OMP=config.multithreaded, dtype=inv_dtype)
+            return Matrix._from_flat(c_inv, self.n, self.n, template=self, dtype=inv_dtype)
 
-        raise NotImplementedError("Inverse for matrices larger than 2x2 is not implemented in pure Python.")
+        py_inv: array.array = pykernels.mat_inv(self.entries, self.n, dtype=inv_dtype)
+        return Matrix._from_flat(py_inv, self.n, self.n, template=self, dtype=inv_dtype)
 
     # --- DUNDER METHODS ---
 
     def __repr__(self) -> str:
-        """GENERATE STRING REPRESENTATION OF MATRIX"""
-        if self._cached_repr is not None:
-            return self._cached_repr
+        """GENERATE STRING REPRESENTATION OF MATRIX (CORNERS ONLY ABOVE repr_threshold ENTRIES)"""
+        # The cache is keyed on the print options so set_printoptions invalidates it
+        options: Tuple[int, int] = (Matrix.repr_threshold, Matrix.repr_edgeitems)
+        if self._cached_repr is not None and self._cached_repr[0] == options:
+            return self._cached_repr[1]
 
         if not self.entries:
             return "[]"
 
-        formatted: List[str]
-        if hasattr(self, 'sig_digits') and self.sig_digits >= 0:
-            formatted = [f"{val:.{self.sig_digits}g}" for val in self.entries]
-        else:
-            formatted = [f"{val}" for val in self.entries]
+        summarize: bool = self.m * self.n > Matrix.repr_threshold
+        rows: List[Optional[int]] = Matrix._edge_indices(self.m, Matrix.repr_edgeitems, summarize)
+        cols: List[Optional[int]] = Matrix._edge_indices(self.n, Matrix.repr_edgeitems, summarize)
 
-        min_val: float = min(self.entries)
-        max_val: float = max(self.entries)
+        use_color: bool = self.config.use_color
+        min_val, max_val = self._minmax() if use_color else (0, 0)
         range_val: float = max_val - min_val
 
         def get_color(value: float) -> str:
@@ -224,93 +501,135 @@ class Matrix:
             color_idx: int = int(normalized * (len(colors) - 1))
             return f"\033[38;5;{colors[color_idx]}m"
 
-        width: int = max(len(f) for f in formatted)
+        grid: List[List[Tuple[Optional[float], str]]] = []
+        for i in rows:
+            if i is None:
+                grid.append([(None, "⋱" if j is None else "⋮") for j in cols])
+                continue
+            grid.append([
+                (None, "…") if j is None else (self.entries[i * self.n + j], self._format_entry(self.entries[i * self.n + j]))
+                for j in cols
+            ])
+
+        width: int = max(len(display) for row in grid for _, display in row)
         reset: str = "\033[0m"
-        rows_list: List[str] = []
 
-        if len(self.entries) <= self.n:
-            row_parts: List[str] = [
-                f"{get_color(val)}{display:>{width}}{reset}" if getattr(self, 'use_color', False) else f"{display:>{width}}"
-                for val, display in zip(self.entries, formatted)
-            ]
-            row: str = '  '.join(row_parts)
-            self._cached_repr = f"[ {row} ]"
-            return self._cached_repr
-
-        for j in range(0, len(self.entries), self.n):
-            row_parts_multi: List[str] = []
-            for idx, val in enumerate(self.entries[j : j + self.n]):
-                display_val: str = formatted[j + idx]
-                if getattr(self, 'use_color', False):
-                    row_parts_multi.append(f"{get_color(val)}{display_val:>{width}}{reset}")
+        def render(row: List[Tuple[Optional[float], str]]) -> str:
+            """RENDER ONE ROW OF CELLS, COLORING NUMERIC ENTRIES"""
+            return '  '.join(
+                f"{get_color(val)}{display:>{width}}{reset}" if use_color and val is not None else f"{display:>{width}}"
+                for val, display in row
+            )
+
+        rows_list: List[str] = []
+        if self.m == 1:
+            rows_list.append(f"[ {render(grid[0])} ]")
+        else:
+            for idx, row in enumerate(grid):
+                if idx == 0:
+                    rows_list.append(f"┌ {render(row)} ┐")
+                elif idx == len(grid) - 1:
+                    rows_list.append(f"└ {render(row)} ┘")
                 else:
-                    row_parts_multi.append(f"{display_val:>{width}}")
+                    rows_list.append(f"│ {render(row)} │")
+
+        if summarize:
+            rows_list.append(f"({self.m}x{self.n}, {self.dtype.name})")
 
-            row_str: str = '  '.join(row_parts_multi)
-            if j == 0:
-                rows_list.append(f"┌ {row_str} ┐")
-            elif j + self.n >= len(self.entries):
-                rows_list.append(f"└ {row_str} ┘")
-            else:
-                rows_list.append(f"│ {row_str} │")
+        text: str = '\n'.join(rows_list)
+        self._cached_repr = (options, text)
+        return text
 
-        self._cached_repr = '\n'.join(rows_list)
-        return self._cached_repr
+    def __abs__(self) -> Self:
+        """ELEMENTWISE ABSOLUTE VALUE"""
+        return self.abs()
 
-    @validate_dimensions("elementwise")
+    @validate_dimensions("broadcast")
     @performance_warning()
-    def __add__(self, other: Self) -> Self:
-        """ADD TWO MATRICES"""
-        if not self.force_C:
-            summed_entries: List[float] = [i + j for i, j in zip(self.entries, other.entries)]
-            return Matrix._from_flat(summed_entries, self.n, self.m, template=self)
-        
-        C_entries: List[float] = cmat.mat_add(self.entries, other.entries, self.m, self.n, use_OMP=self.multithreaded)
-        return Matrix._from_flat(C_entries, self.n, self.m)
+    def __add__(self, other: Union[Self, float, int]) -> Self:
+        """ADD TWO MATRICES, OR BROADCAST A SCALAR, ROW OR COLUMN VECTOR"""
+        return self._broadcast(other, "mat_add")
 
-    @validate_dimensions("elementwise")
     @performance_warning()
-    def __sub__(self, other: Self) -> Self:
-        """SUBTRACT TWO MATRICES"""
-        if not self.force_C:
-            subbed_entries: List[float] = [i - j for i, j in zip(self.entries, other.entries)]
-            return Matrix._from_flat(subbed_entries, self.n, self.m, template=self)
-        
-        C_entries: List[float] = cmat.mat_sub(self.entries, other.entries, self.m, self.n, use_OMP=self.multithreaded)
-        return Matrix._from_flat(C_entries, self.n, self.m, template=self)
+    def __radd__(self, other: Union[float, int]) -> Self:
+        """ADD A MATRIX TO A SCALAR"""
+        if not isinstance(other, (float, int)):
+            return NotImplemented
+        return self._broadcast(other, "mat_add", reflected=True)
+
+    @validate_dimensions("broadcast")
+    @performance_warning()
+    def __sub__(self, other: Union[Self, float, int]) -> Self:
+        """SUBTRACT TWO MATRICES, OR BROADCAST A SCALAR, ROW OR COLUMN VECTOR"""
+        return self._broadcast(other, "mat_sub")
+
+    @performance_warning()
+    def __rsub__(self, other: Union[float, int]) -> Self:
+        """SUBTRACT A MATRIX FROM A SCALAR"""
+        if not isinstance(other, (float, int)):
+            return NotImplemented
+        return self._broadcast(other, "mat_sub", reflected=True)
 
     @validate_dimensions("matmul")
     @performance_warning()
     def __mul__(self, other: Union[Self, float, int]) -> Union[Self, float]:
         """PERFORM MATRIX MULTIPLICATION OR SCALAR MULTIPLICATION"""
+        config: MatrixConfig = self.config
         if isinstance(other, (float, int)):
-            return self._smul(float(other))
+            return self._smul(other)
 
-        if not self.use_C:
+        dtype: DType = promote_types(self.dtype, other.dtype)
+        if not config.use_C:
             mult_entries: List[float] = []
             for i in range(self.m):
                 for j in range(other.n):
                     val: float = sum(self.entries[i * self.n + k] * other.entries[k * other.n + j] for k in range(self.n))
                     mult_entries.append(val)
-            return Matrix._from_flat(mult_entries, other.n, self.m, template=self)
+            return Matrix._from_flat(as_storage(mult_entries, dtype, wrap=True), other.n, self.m, template=self, dtype=dtype)
 
-        C_result: List[float] = cmat.mat_mul(self.entries, other.entries, self.m, self.n, other.n, use_OMP=self.multithreaded)
+        C_result: array.array = cmat.mat_mul(self.entries, other.entries, self.m, self.n, other.n, use_OMP=config.multithreaded, dtype=dtype)
         
         if len(C_result) == 1 and self.m == 1 and other.n == 1:
             return float(C_result[0])
             
-        return Matrix._from_flat(C_result, other.n, self.m, template=self)
+        return Matrix._from_flat(C_result, other.n, self.m, template=self, dtype=dtype)
 
-    @validate_dimensions("elementwise")
+    def __rmul__(self, other: Union[float, int]) -> Self:
+        """PERFORM SCALAR MULTIPLICATION FROM THE LEFT"""
+        if not isinstance(other, (float, int)):
+            return NotImplemented
+        return self._smul(other)
+
+    @validate_dimensions("broadcast")
     @performance_warning()
     def __matmul__(self, other: Union[Self, float, int]) -> Self:
-        """PERFORM HADAMARD PRODUCT (ELEMENT-WISE MULTIPLICATION)"""
+        """PERFORM HADAMARD PRODUCT (ELEMENT-WISE MULTIPLICATION), BROADCASTING ROW OR COLUMN VECTORS"""
         if isinstance(other, (float, int)):
-            return self._smul(float(other))
-        
-        if not self.force_C:
-            mult_entries: List[float] = [i * j for i, j in zip(self.entries, other.entries)]
-            return Matrix._from_flat(mult_entries, self.n, self.m, template=self)
-            
-        C_entries: List[float] = cmat.hadamard(self.entries, other.entries, self.m, self.n, use_OMP=self.multithreaded)
-        return Matrix._from_flat(C_entries, self.n, self.m, template=self)
\ No newline at end of file
+            return self._smul(other)
+        return self._broadcast(other, "hadamard")
+
+    @validate_dimensions("broadcast")
+    @performance_warning()
+    def __truediv__(self, other: Union[Self, float, int]) -> Self:
+        """ELEMENT-WISE DIVISION, BROADCASTING A SCALAR, ROW OR COLUMN VECTOR (INTEGERS PROMOTE TO FLOAT64)"""
+        return self._broadcast(other, "mat_div")
+
+    @performance_warning()
+    def __rtruediv__(self, other: Union[float, int]) -> Self:
+        """DIVIDE A SCALAR BY EACH ENTRY"""
+        if not isinstance(other, (float, int)):
+            return NotImplemented
+        return self._broadcast(other, "mat_div", reflected=True)
+
+    @validate_dimensions("square")
+    @performance_warning()
+    def __pow__(self, k: int) -> Self:
+        """MATRIX POWER BY REPEATED SQUARING; NEGATIVE POWERS RAISE THE INVERSE"""
+        if isinstance(k, bool) or not isinstance(k, int):
+            return NotImplemented
+
+        config: MatrixConfig = self.config
+        base: Self = self.inverse if k < 0 else self
+        backend: Any = cmat if config.use_C else pykernels
+        entries: array.array = backend.mat_pow(base.entries, self.n, abs(k), use_OMP=config.multithreaded, dtype=base.dtype)
+        return Matrix._from_flat(entries, self.n, self.n, template=self, dtype=base.dtype)
@@ -0,0 +1,65 @@
+# src/ufuncs.py
+"""
+Module-level forms of the Matrix elementwise functions, so that
+hjortmath.exp(A) is A.exp(). All of them run in C unless use_C is off.
+"""
+
+from .imports import *
+from .pymat import Matrix
+
+
+def exp(x: Matrix, inplace: bool = False) -> Matrix:
+    """ELEMENTWISE EXPONENTIAL"""
+    return x.exp(inplace=inplace)
+
+def log(x: Matrix, inplace: bool = False) -> Matrix:
+    """ELEMENTWISE NATURAL LOGARITHM"""
+    return x.log(inplace=inplace)
+
+def sqrt(x: Matrix, inplace: bool = False) -> Matrix:
+    """ELEMENTWISE SQUARE ROOT"""
+    return x.sqrt(inplace=inplace)
+
+def tanh(x: Matrix, inplace: bool = False) -> Matrix:
+    """ELEMENTWISE HYPERBOLIC TANGENT"""
+    return x.tanh(inplace=inplace)
+
+def sigmoid(x: Matrix, inplace: bool = False) -> Matrix:
+    """ELEMENTWISE LOGISTIC SIGMOID"""
+    return x.sigmoid(inplace=inplace)
+
+def absolute(x: Matrix, inplace: bool = False) -> Matrix:
+    """ELEMENTWISE ABSOLUTE VALUE"""
+    return x.abs(inplace=inplace)
+
+def power(x: Matrix, exponent: Union[float, int], inplace: bool = False) -> Matrix:
+    """RAISE EACH ENTRY TO A SCALAR EXPONENT"""
+    return x.power(exponent, inplace=inplace)
+
+def clip(x: Matrix, low: Union[float, int], high: Union[float, int], inplace: bool = False) -> Matrix:
+    """LIMIT EACH ENTRY TO THE RANGE [LOW, HIGH]"""
+    return x.clip(low, high, inplace=inplace)
+
+def gt(x: Matrix, value: Union[float, int]) -> Matrix:
+    """MASK (1/0) OF ENTRIES GREATER THAN VALUE"""
+    return x.gt(value)
+
+def ge(x: Matrix, value: Union[float, int]) -> Matrix:
+    """MASK (1/0) OF ENTRIES GREATER THAN OR EQUAL TO VALUE"""
+    return x.ge(value)
+
+def lt(x: Matrix, value: Union[float, int]) -> Matrix:
+    """MASK (1/0) OF ENTRIES LESS THAN VALUE"""
+    return x.lt(value)
+
+def le(x: Matrix, value: Union[float, int]) -> Matrix:
+    """MASK (1/0) OF ENTRIES LESS THAN OR EQUAL TO VALUE"""
+    return x.le(value)
+
+def eq(x: Matrix, value: Union[float, int]) -> Matrix:
+    """MASK (1/0) OF ENTRIES EQUAL TO VALUE"""
+    return x.eq(value)
+
+def ne(x: Matrix, value: Union[float, int]) -> Matrix:
+    """MASK (1/0) OF ENTRIES NOT EQUAL TO VALUE"""
+    return x.ne(value)
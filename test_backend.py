@@ -0,0 +1,73 @@
+import json
+import math
+import os
+import subprocess
+import sys
+
+import pytest
+
+from hjortmath import Matrix, backend_info, cmat, native_available, pykernels
+
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+MISSING_LIBRARY = r"""
+import json, warnings
+import hjortmath
+from hjortmath import cmat
+
+report = {"attempted_on_import": cmat._load_attempted}
+cmat.LIB_PATH = "/nonexistent/libcmat.so"
+with warnings.catch_warnings(record=True) as caught:
+    warnings.simplefilter("always")
+    A = hjortmath.Matrix((1.0, 2.0), (3.0, 4.0))
+    report["product"] = (A * A).tolist()
+    report["sum"] = (A + A).tolist()
+    report["exp"] = A.exp().tolist()
+report["warnings"] = [(w.category.__name__, str(w.message)) for w in caught]
+report["native_available"] = hjortmath.native_available()
+report["info"] = hjortmath.backend_info()
+print(json.dumps(report))
+"""
+
+
+def run_isolated(script):
+    """Run `script` in a fresh interpreter so the lazy load starts from scratch"""
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    result = subprocess.run([sys.executable, "-c", script], cwd=ROOT, env=env, capture_output=True, text=True, check=True)
+    return json.loads(result.stdout)
+
+
+def test_missing_library_falls_back_with_one_warning():
+    report = run_isolated(MISSING_LIBRARY)
+    assert report["attempted_on_import"] is False
+
+    assert len(report["warnings"]) == 1
+    category, message = report["warnings"][0]
+    assert category == "RuntimeWarning" and "/nonexistent/libcmat.so" in message
+
+    assert report["product"] == [[7.0, 10.0], [15.0, 22.0]]
+    assert report["sum"] == [[2.0, 4.0], [6.0, 8.0]]
+    assert report["exp"] == [[math.exp(1), math.exp(2)], [math.exp(3), math.exp(4)]]
+
+    assert report["native_available"] is False
+    info = report["info"]
+    assert info["backend"] == "python" and info["library"] == "/nonexistent/libcmat.so"
+    assert "/nonexistent/libcmat.so" in info["error"]
+
+
+def test_backend_info_describes_the_loaded_library():
+    info = backend_info()
+    assert info["backend"] == ("native" if native_available() else "python")
+    assert info["library"] == cmat.LIB_PATH
+    assert info["threads"] >= 1
+    if info["backend"] == "native":
+        assert info["error"] is None and info["openmp"] == (info["openmp_version"] > 0)
+
+
+@pytest.mark.skipif(not native_available(), reason="libcmat.so is not built")
+@pytest.mark.parametrize("kernel", ["mat_add", "mat_sub", "hadamard"])
+def test_fallback_kernels_match_native(kernel):
+    A = Matrix.rand(5, 5, seed=1).entries
+    B = Matrix.rand(5, 5, seed=2).entries
+    assert getattr(cmat, kernel)(A, B) == getattr(pykernels, kernel)(A, B)
@@ -0,0 +1,39 @@
+import math
+
+import pytest
+
+from hjortmath import Matrix, config_context, float64, int32
+
+
+def test_broadcast_row_and_column(use_C):
+    with config_context(use_C=use_C):
+        A = Matrix((1.0, 2.0, 3.0), (4.0, 5.0, 6.0))
+        assert (A + Matrix((10.0, 20.0, 30.0))).tolist() == [[11, 22, 33], [14, 25, 36]]
+        assert (A - Matrix((1.0,), (2.0,))).tolist() == [[0, 1, 2], [2, 3, 4]]
+        assert (Matrix((1.0,), (2.0,)) + Matrix((10.0, 20.0))).tolist() == [[11, 21], [12, 22]]
+
+
+def test_reflected_scalar_operations(use_C):
+    with config_context(use_C=use_C):
+        A = Matrix((1.0, 2.0), (4.0, 8.0))
+        assert (1 - A).tolist() == [[0, -1], [-3, -7]]
+        assert (8 / A).tolist() == [[8, 4], [2, 1]]
+        assert (2 + A).tolist() == (A + 2).tolist()
+
+
+def test_broadcast_rejects_incompatible_shapes():
+    with pytest.raises(ValueError):
+        Matrix((1.0, 2.0, 3.0)) + Matrix((1.0, 2.0))
+
+
+def test_division_by_zero_does_not_depend_on_shape(use_C):
+    with config_context(use_C=use_C):
+        assert (Matrix((1.0,)) / 0).tolist() == [[math.inf]]
+        assert (Matrix((1.0, 2.0)) / Matrix((0.0, 1.0))).tolist() == [[math.inf, 2.0]]
+        assert (Matrix((1.0, 2.0), (3.0, 4.0)) / 0).tolist() == [[math.inf] * 2] * 2
+
+
+def test_integer_division_returns_floats(use_C):
+    with config_context(use_C=use_C):
+        Q = Matrix((1, 3), dtype=int32) / Matrix((2, 0), dtype=int32)
+    assert Q.dtype is float64 and Q.tolist() == [[0.5, math.inf]]
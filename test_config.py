@@ -0,0 +1,59 @@
+import pickle
+import threading
+
+import pytest
+
+from hjortmath import Matrix, config_context
+from hjortmath.config import DEFAULT_CONFIG, get_default_config
+
+
+def test_matrices_with_the_same_options_share_one_config():
+    A = Matrix((1.0, 2.0), use_color=False)
+    B = Matrix((3.0, 4.0), use_color=False)
+    assert A.config is B.config
+    assert (A + B).config is A.config
+    assert Matrix((1.0,)).config is DEFAULT_CONFIG
+    assert not hasattr(A, "__dict__")
+
+
+def test_assigning_an_option_swaps_in_the_shared_config():
+    A = Matrix((1.0, 2.0))
+    A.sig_digits = 2
+    assert A.config is Matrix((1.0,), sig_digits=2).config
+    assert DEFAULT_CONFIG.sig_digits == 4
+
+
+def test_disable_warnings_is_an_alias():
+    assert Matrix((1.0,), disable_warnings=True).config is Matrix((1.0,), disable_perf_hints=True).config
+
+
+def test_config_context_sets_and_restores_the_default():
+    with config_context(use_C=False, sig_digits=6) as config:
+        assert Matrix((1.0,)).config is config
+        assert not config.use_C and config.sig_digits == 6
+        with config_context(use_color=False):
+            assert not get_default_config().use_C and not get_default_config().use_color
+        assert get_default_config() is config
+    assert get_default_config() is DEFAULT_CONFIG
+
+
+def test_config_context_is_thread_local():
+    seen = []
+    with config_context(use_C=False):
+        thread = threading.Thread(target=lambda: seen.append(get_default_config()))
+        thread.start()
+        thread.join()
+    assert seen == [DEFAULT_CONFIG]
+
+
+def test_config_context_rejects_unknown_options():
+    with pytest.raises(TypeError):
+        with config_context(use_cc=False):
+            pass
+
+
+def test_unpickled_matrix_shares_interned_config():
+    A = Matrix((1.0, 2.0), use_color=False)
+    B = pickle.loads(pickle.dumps(A))
+    assert B.config is A.config
+    assert B.dtype is A.dtype and B.entries == A.entries
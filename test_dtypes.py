@@ -0,0 +1,62 @@
+import pickle
+
+import pytest
+
+from hjortmath import Matrix, config_context, float32, float64, int32, int64
+from hjortmath import cmat, pykernels
+
+
+def test_promotion_rules():
+    assert (Matrix((1, 2), dtype=int32) + Matrix((1, 2), dtype=int64)).dtype is int64
+    assert (Matrix((1.0, 2.0), dtype=float32) + Matrix((1, 2), dtype=int32)).dtype is float64
+    assert (Matrix((1, 2), dtype=int32) + 1).dtype is int32
+    assert (Matrix((1, 2), dtype=int32) + 1.5).dtype is float64
+    assert (Matrix((1, 2), dtype=int64) / Matrix((1, 2), dtype=int64)).dtype is float64
+
+
+def test_entries_use_the_dtype_storage():
+    A = Matrix((1.5, 2.0), dtype=float32)
+    assert A.entries.typecode == "f" and A.itemsize == 4 and A.nbytes == 8
+    assert Matrix((1, 2)).dtype is float64
+    assert pickle.loads(pickle.dumps(int32)) is int32
+
+
+def test_astype_copies_by_default():
+    A = Matrix((1.0, 2.0))
+    B = A.astype(float64)
+    assert B.entries is not A.entries
+    B.exp(inplace=True)
+    assert A.tolist() == [[1.0, 2.0]]
+    assert A.astype(float64, copy=False) is A
+
+
+def test_astype_rejects_values_that_do_not_fit():
+    with pytest.raises(OverflowError):
+        Matrix((2**40, 1)).astype(int32)
+
+
+def test_int_scalars_widen_instead_of_wrapping(use_C):
+    with config_context(use_C=use_C):
+        A = Matrix((1, 2, 3), dtype=int32)
+        B = A * 2**32
+        C = A * 2**70
+    assert B.dtype is int64 and B.tolist() == [[2**32, 2**33, 3 * 2**32]]
+    assert C.dtype is float64 and C.tolist() == [[2.0**70, 2.0**71, 3 * 2.0**70]]
+    assert (A + 2**31).dtype is int64
+
+
+@pytest.mark.parametrize("kernel", [cmat, pykernels])
+def test_scalar_kernel_rejects_scalars_outside_the_dtype(kernel):
+    with pytest.raises(OverflowError):
+        kernel.scalar_mul(Matrix((1, 2), dtype=int32).entries, 2**32, dtype=int32)
+
+
+def test_integer_overflow_wraps_on_every_backend(use_C):
+    with config_context(use_C=use_C):
+        A = Matrix((100000, 1), (1, 100000), dtype=int32)
+        assert (A * A).tolist() == [[1410065409, 200000], [200000, 1410065409]]
+        kernels = cmat if use_C else pykernels
+        assert list(kernels.hadamard(A.entries, A.entries, dtype=int32)) == [1410065408, 1, 1, 1410065408]
+        assert (A * 30000).tolist() == [[-1294967296, 30000], [30000, -1294967296]]
+        assert abs(Matrix((-2**31, 5), dtype=int32)).tolist() == [[-2**31, 5]]
+        assert (Matrix((2**62, 1), dtype=int64) * 4).tolist() == [[0, 4]]
@@ -0,0 +1,69 @@
+import math
+
+import pytest
+
+from hjortmath import Matrix, config_context, float64, int64
+
+
+def close(a, b, tol):
+    return all(abs(x - y) <= tol * max(1.0, abs(y)) for x, y in zip(a, b))
+
+
+@pytest.mark.parametrize("dtype", [float64, int64])
+def test_pow_matches_repeated_multiplication(use_C, dtype):
+    with config_context(use_C=use_C, disable_perf_hints=True):
+        A = Matrix.randint(4, 4, -3, 4, seed=2).astype(dtype)
+        expected = Matrix.identity(4, dtype=dtype)
+        for k in range(8):
+            assert (A ** k).tolist() == expected.tolist()
+            expected = expected * A
+
+
+def test_negative_pow_uses_inverse(use_C):
+    with config_context(use_C=use_C, disable_perf_hints=True):
+        A = Matrix((2.0, 1.0, 0.0), (1.0, 3.0, 1.0), (0.0, 1.0, 4.0))
+        product = (A ** -3) * (A * A * A)
+    assert close(product.entries, Matrix.identity(3).entries, 1e-12)
+
+
+def test_pow_rejects_non_square_and_non_integer():
+    with pytest.raises(ValueError):
+        Matrix.rand(2, 3) ** 2
+    with pytest.raises(TypeError):
+        Matrix.rand(2, 2) ** 1.5
+
+
+def test_expm_rotation(use_C):
+    with config_context(use_C=use_C):
+        E = Matrix((0.0, 1.0), (-1.0, 0.0)).expm()
+    assert close(E.entries, [math.cos(1), math.sin(1), -math.sin(1), math.cos(1)], 1e-14)
+
+
+@pytest.mark.parametrize("scale", [1e-3, 0.5, 3.0, 20.0])
+def test_expm_diagonal(use_C, scale):
+    with config_context(use_C=use_C):
+        E = Matrix((scale, 0.0), (0.0, -scale)).expm()
+    assert close(E.entries, [math.exp(scale), 0.0, 0.0, math.exp(-scale)], 1e-12)
+
+
+def test_expm_promotes_integers_and_propagates_nan():
+    assert Matrix((1, 1), (0, 1)).expm().dtype is float64
+    assert all(math.isnan(v) for v in Matrix((math.nan, 0.0), (0.0, 1.0)).expm().entries)
+
+
+def test_pow_with_exponents_beyond_64_bits(use_C):
+    with config_context(use_C=use_C):
+        S = Matrix((0.0, 1.0), (1.0, 0.0))
+        H = Matrix((0.5, 0.5), (0.5, 0.5))
+        assert (S ** 2**64).tolist() == [[1.0, 0.0], [0.0, 1.0]]
+        assert (S ** (2**64 + 1)).tolist() == S.tolist()
+        assert (H ** (2**100 + 3)).tolist() == H.tolist()
+
+
+def test_pow_beyond_64_bits_matches_between_backends(use_C):
+    F = Matrix((1, 1), (1, 0), dtype=int64)
+    with config_context(use_C=False):
+        expected = (F ** (2**64 + 5)).tolist()
+    with config_context(use_C=use_C):
+        assert (F ** (2**64 + 5)).tolist() == expected
+        assert (F ** (2**64 + 5)).dtype is int64
@@ -0,0 +1,93 @@
+import pytest
+
+from hjortmath import Matrix, config_context, float32, float64, int32, int64
+from hjortmath import cmat, pykernels
+
+
+needs_native = pytest.mark.skipif(not cmat.native_available(), reason="libcmat.so is not built")
+
+RANDOM_CASES = [
+    ("random_uniform", -2.0, 3.0, "float64"),
+    ("random_uniform", 0.0, 1.0, "float32"),
+    ("random_normal", 1.0, 2.0, "float64"),
+    ("random_normal", 0.0, 1.0, "float32"),
+    ("random_integers", -5, 7, "int64"),
+    ("random_integers", 0, 3, "int32"),
+    ("random_integers", -2**63, 2**63, "int64"),
+    ("random_integers", -2**31, 2**31, "int32"),
+]
+
+
+def test_philox_known_answer():
+    assert pykernels.philox4x32_10((0, 0, 0, 0), 0) == (0x6627E8D5, 0xE169C58D, 0xBC57AC4C, 0x9B00DBD8)
+
+
+@needs_native
+@pytest.mark.parametrize("kernel, a, b, dtype", RANDOM_CASES)
+@pytest.mark.parametrize("seed", [0, 12345, 2**64 - 1])
+def test_native_streams_match_python(kernel, a, b, dtype, seed):
+    native = getattr(cmat, kernel)(1001, seed, a, b, dtype=dtype)
+    python = getattr(pykernels, kernel)(1001, seed, a, b, dtype=dtype)
+    assert native == python
+
+
+@needs_native
+@pytest.mark.parametrize("kernel, a, b, dtype", RANDOM_CASES)
+def test_streams_do_not_depend_on_threads(kernel, a, b, dtype):
+    threaded = getattr(cmat, kernel)(20001, 7, a, b, use_OMP=True, dtype=dtype)
+    serial = getattr(cmat, kernel)(20001, 7, a, b, use_OMP=False, dtype=dtype)
+    assert threaded == serial
+
+
+def test_seeded_matrices_are_reproducible_across_backends():
+    A = Matrix.rand(3, 4, seed=7)
+    with config_context(use_C=False):
+        B = Matrix.rand(3, 4, seed=7)
+    with config_context(multithreaded=False):
+        C = Matrix.rand(3, 4, seed=7)
+    assert (A.m, A.n) == (4, 3)
+    assert A.entries == B.entries == C.entries
+
+
+@pytest.mark.parametrize("low, high, dtype", [(1.0, 1.0000001, float32), (1.0, 1.0000000000000002, float64)])
+def test_uniform_stays_below_high(use_C, low, high, dtype):
+    with config_context(use_C=use_C):
+        A = Matrix.rand(50, 50, low=low, high=high, dtype=dtype, seed=1)
+    assert A.max() < high
+
+
+def test_randint_covers_full_int64_range(use_C):
+    with config_context(use_C=use_C):
+        A = Matrix.randint(20, 20, -2**63, 2**63, seed=3)
+    assert A.dtype is int64
+    assert A.min() < -2**60 and A.max() > 2**60
+
+
+@pytest.mark.parametrize("low, high, dtype", [(0, 2**40, int32), (0, 2**64, int64), (3, 3, int64), (-2**63 - 1, 0, int64)])
+def test_randint_rejects_bad_bounds(low, high, dtype):
+    with pytest.raises(ValueError):
+        Matrix.randint(2, 2, low, high, dtype=dtype)
+
+
+def test_random_dtype_checks():
+    with pytest.raises(TypeError):
+        Matrix.rand(2, 2, dtype=int32)
+    with pytest.raises(TypeError):
+        Matrix.randint(2, 2, 0, 5, dtype=float64)
+
+
+def test_integer_draws_stay_in_bounds(use_C):
+    with config_context(use_C=use_C):
+        A = Matrix.randint(30, 30, -2, 3, dtype=int32, seed=5)
+    assert A.dtype is int32 and sorted(set(A.entries)) == [-2, -1, 0, 1, 2]
+
+
+def test_pure_python_draws_print_a_perf_hint(capsys):
+    with config_context(use_C=False):
+        Matrix.rand(2, 2, seed=1)
+        assert capsys.readouterr().out == ""
+        Matrix.rand(250, 201, seed=1)
+        assert "Just a heads up!" in capsys.readouterr().out
+    with config_context(use_C=False, disable_perf_hints=True):
+        Matrix.rand(250, 201, seed=1)
+        assert capsys.readouterr().out == ""
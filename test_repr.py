@@ -0,0 +1,76 @@
+import io
+
+import pytest
+
+from hjortmath import Matrix, config_context, int32
+
+
+def plain(A):
+    A.use_color = False
+    return A
+
+
+def test_large_matrices_are_summarized():
+    A = plain(Matrix.rand(40, 40, seed=1))
+    lines = repr(A).splitlines()
+    assert len(lines) == 8 and lines[-1] == "(40x40, float64)"
+    assert lines[0].startswith("┌") and lines[6].startswith("└")
+    assert all(line.count("…") == 1 for line in lines[:3] + lines[4:7])
+    assert lines[3].count("⋮") == 6 and lines[3].count("⋱") == 1
+
+    corners = [A.tolist()[i][j] for i in (0, -1) for j in (0, -1)]
+    assert lines[0].split()[1] == A._format_entry(corners[0])
+    assert lines[0].split()[-2] == A._format_entry(corners[1])
+    assert lines[6].split()[1] == A._format_entry(corners[2])
+    assert lines[6].split()[-2] == A._format_entry(corners[3])
+
+
+def test_summary_uses_edgeitems():
+    A = plain(Matrix.rand(40, 40, seed=1))
+    try:
+        Matrix.set_printoptions(edgeitems=2)
+        lines = repr(A).splitlines()
+    finally:
+        Matrix.set_printoptions(edgeitems=3)
+    assert len(lines) == 6 and len(lines[0].split()) == 2 + 2 * 2 + 1
+
+
+def test_small_matrices_are_printed_in_full():
+    assert repr(plain(Matrix((1, 2), (3, 4), dtype=int32))) == "┌ 1  2 ┐\n└ 3  4 ┘"
+    assert repr(plain(Matrix((1.5, 2.0)))) == "[ 1.5    2 ]"
+
+
+def test_set_printoptions_validates():
+    with pytest.raises(ValueError):
+        Matrix.set_printoptions(threshold=-1)
+    with pytest.raises(ValueError):
+        Matrix.set_printoptions(edgeitems=0)
+
+
+def test_set_printoptions_invalidates_cached_repr():
+    A = plain(Matrix.rand(40, 40, seed=1))
+    try:
+        summary = repr(A)
+        Matrix.set_printoptions(threshold=2000)
+        assert len(repr(A).splitlines()) == 40
+    finally:
+        Matrix.set_printoptions(threshold=1000)
+    assert repr(A) == summary
+
+
+def test_min_and_max(use_C):
+    with config_context(use_C=use_C):
+        A = Matrix((3.0, -7.5, 2.0), (0.0, 11.25, -1.0))
+        B = Matrix((5, -2**31, 2**31 - 1), dtype=int32)
+        assert (A.min(), A.max()) == (-7.5, 11.25)
+        assert (B.min(), B.max()) == (-2**31, 2**31 - 1)
+
+
+def test_write_to_keeps_full_precision():
+    out = io.StringIO()
+    Matrix((1 / 3, 123456.789)).write_to(out)
+    assert out.getvalue() == "0.3333333333333333  123456.789\n"
+
+    out = io.StringIO()
+    Matrix((1 / 3, 123456.789)).write_to(out, precision=3)
+    assert out.getvalue() == "0.333  1.23e+05\n"
@@ -0,0 +1,125 @@
+import math
+
+import pytest
+
+import hjortmath
+from hjortmath import Matrix, config_context, float32, float64, int32, int64
+
+
+needs_native = pytest.mark.skipif(not hjortmath.native_available(), reason="libcmat.so is not built")
+
+VALUES = (-3.5, -1.0, -0.0, 0.0, 0.25, 1.0, 2.0, 40.0)
+
+UNARY_CASES = [
+    ("exp", math.exp),
+    ("log", lambda x: math.log(x) if x > 0 else (-math.inf if x == 0 else math.nan)),
+    ("sqrt", lambda x: math.sqrt(x) if x >= 0 else math.nan),
+    ("tanh", math.tanh),
+    ("sigmoid", lambda x: 1 / (1 + math.exp(-x))),
+    ("abs", abs),
+]
+
+
+def same(a, b):
+    """Elementwise equality that treats nan as equal and distinguishes -0.0 from 0.0"""
+    return len(a) == len(b) and all(
+        (x != x and y != y) or (x == y and math.copysign(1, x) == math.copysign(1, y)) for x, y in zip(a, b)
+    )
+
+
+def close(a, b, tol):
+    return len(a) == len(b) and all(
+        (x != x and y != y) or x == y or abs(x - y) <= tol * max(1.0, abs(y)) for x, y in zip(a, b)
+    )
+
+
+@pytest.mark.parametrize("name, reference", UNARY_CASES)
+@pytest.mark.parametrize("dtype, tol", [(float64, 1e-15), (float32, 1e-6)])
+def test_unary_ufuncs_match_math(use_C, name, reference, dtype, tol):
+    with config_context(use_C=use_C):
+        A = getattr(Matrix(VALUES, dtype=dtype), name)()
+    assert A.dtype is dtype
+    assert close(A.entries, [reference(dtype.cast(x)) for x in VALUES], tol)
+
+
+@pytest.mark.parametrize("name, reference", UNARY_CASES)
+def test_inplace_ufuncs_reuse_the_storage(use_C, name, reference):
+    with config_context(use_C=use_C):
+        A = Matrix(VALUES)
+        entries = A.entries
+        assert getattr(A, name)(inplace=True) is A
+    assert A.entries is entries
+    assert close(A.entries, [reference(x) for x in VALUES], 1e-15)
+
+
+def test_float_ufuncs_promote_integer_matrices(use_C):
+    with config_context(use_C=use_C):
+        A = Matrix((1, 4, 9), dtype=int32)
+        assert A.sqrt().dtype is float64 and A.sqrt().tolist() == [[1.0, 2.0, 3.0]]
+        assert A.abs().dtype is int32
+        assert A.clip(2, 5).dtype is int32
+        assert A.clip(2.5, 5).dtype is float64
+        with pytest.raises(TypeError):
+            A.exp(inplace=True)
+
+
+def test_clip(use_C):
+    with config_context(use_C=use_C):
+        A = Matrix(VALUES)
+        assert A.clip(-1.0, 1.0).tolist() == [[max(-1.0, min(1.0, x)) for x in VALUES]]
+        assert A.clip(0.0, 2.0, inplace=True) is A
+    assert A.min() == 0.0 and A.max() == 2.0
+
+
+@pytest.mark.parametrize("name, op", [
+    ("gt", lambda x, t: x > t), ("ge", lambda x, t: x >= t), ("lt", lambda x, t: x < t),
+    ("le", lambda x, t: x <= t), ("eq", lambda x, t: x == t), ("ne", lambda x, t: x != t),
+])
+def test_comparison_masks(use_C, name, op):
+    with config_context(use_C=use_C):
+        mask = getattr(Matrix(VALUES), name)(1.0)
+        int_mask = getattr(Matrix((1, 2, 3), dtype=int64), name)(2)
+    assert mask.dtype is float64 and mask.tolist() == [[float(op(x, 1.0)) for x in VALUES]]
+    assert int_mask.dtype is int64 and int_mask.tolist() == [[int(op(x, 2)) for x in (1, 2, 3)]]
+    assert getattr(hjortmath, name)(Matrix(VALUES), 1.0).tolist() == mask.tolist()
+
+
+@pytest.mark.parametrize("threshold", [2**32, -2**32, 2**70, -2**70])
+@pytest.mark.parametrize("name", ["gt", "ge", "lt", "le", "eq", "ne"])
+def test_masks_with_thresholds_outside_the_dtype(use_C, name, threshold):
+    with config_context(use_C=use_C):
+        mask = getattr(Matrix((-5, 0, 5), dtype=int32), name)(threshold)
+    assert mask.dtype is int32
+    assert mask.tolist() == [[int(getattr(x, f"__{name}__")(threshold)) for x in (-5, 0, 5)]]
+
+
+def test_clip_bounds_outside_the_dtype(use_C):
+    with config_context(use_C=use_C):
+        A = Matrix((1, 2, 3), dtype=int32)
+        assert A.clip(0, 2**32).tolist() == [[1, 2, 3]]
+        assert A.clip(-2**40, 2).tolist() == [[1, 2, 2]]
+        assert A.clip(0, 2**32).dtype is int32
+
+
+def test_module_functions_match_methods():
+    A = Matrix((0.5, 2.0))
+    assert hjortmath.exp(A).tolist() == A.exp().tolist()
+    assert hjortmath.absolute(A * -1).tolist() == A.tolist()
+    assert hjortmath.power(A, 2).tolist() == [[0.25, 4.0]]
+    assert hjortmath.clip(A, 1.0, 1.5).tolist() == [[1.0, 1.5]]
+    assert hjortmath.sqrt(A, inplace=True) is A
+
+
+@needs_native
+@pytest.mark.parametrize("p", [-1, -2, -0.5, 0.5, 2, 3, -math.inf, 1.5])
+def test_power_matches_between_backends(p):
+    values = (0.0, -0.0, 4.0, -math.inf, math.inf, -8.0, math.nan)
+    native = Matrix(values).power(p)
+    with config_context(use_C=False):
+        python = Matrix(values).power(p)
+    assert same(native.entries, python.entries)
+
+
+def test_power_of_zero_with_negative_exponent():
+    with config_context(use_C=False):
+        assert Matrix((0.0, -0.0, 4.0)).power(-1).tolist() == [[math.inf, -math.inf, 0.25]]